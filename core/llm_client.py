@@ -4,15 +4,45 @@ Handles conversation state and low-latency LLM inference using httpx.AsyncClient
 """
 
 import os
+import io
 import time
 import httpx
 import json
+import base64
+import asyncio
+import hashlib
+import itertools
+from collections import deque
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+try:
+    from PIL import Image  # Optional - enables server-side image downscaling
+except ImportError:
+    Image = None
+
+try:
+    import orjson  # Faster JSON on the hot path; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+
+def _json_dumps_bytes(obj) -> bytes:
+    """Serialize to JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON from bytes/str with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Global session context storage - In-memory dictionary for prototype
 # NOTE: This is process-unsafe with multiple Uvicorn workers
 # Production deployment requires Redis/PostgreSQL for shared state
@@ -21,6 +51,42 @@ SESSION_CONTEXTS: Dict[str, dict] = {}
 # Global Groq async client instance
 groq_client: Optional[httpx.AsyncClient] = None
 
+# Background task that evicts idle sessions (started by init_client)
+_reaper_task: Optional[asyncio.Task] = None
+
+# Optional keepalive ping task (started by warmup_client when enabled)
+_keepalive_task: Optional[asyncio.Task] = None
+
+# Interval for keepalive pings that hold the HTTP/2 connection open
+# between infrequent utterances; 0 disables the loop
+GROQ_KEEPALIVE_SECONDS = int(os.getenv("GROQ_KEEPALIVE_SECONDS", 0))
+
+# Idle-session eviction policy - sessions untouched for longer than the TTL
+# are dropped so crashed clients don't leak memory indefinitely
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 1800))
+SESSION_REAPER_INTERVAL_SECONDS = 60
+
+# Concurrency gate for in-flight Groq requests. Bursts of sessions would
+# otherwise stampede the API rate limit; bounded in-flight requests pair
+# with HTTP/2 multiplexing to keep one connection saturated instead.
+GROQ_MAX_INFLIGHT = int(os.getenv("GROQ_MAX_INFLIGHT", 8))
+_llm_semaphore = asyncio.Semaphore(GROQ_MAX_INFLIGHT)
+
+# Retry policy for transient API failures (rate limits / server errors)
+_RETRYABLE_STATUS = {429, 500, 502, 503}
+_MAX_RETRIES = 2
+
+# Images above this base64 size get downscaled before upload (when Pillow
+# is available) - saves transport bandwidth and tokenizer cost
+_IMAGE_RESIZE_THRESHOLD = 200 * 1024  # base64 chars
+_IMAGE_MAX_DIMENSION = 768            # px, long side
+_IMAGE_JPEG_QUALITY = 75
+
+# Resized-image cache keyed by sha256 of the input, so retries of the
+# same capture don't repeat the decode/resize work
+_RESIZED_IMAGE_CACHE: Dict[str, str] = {}
+_RESIZED_IMAGE_CACHE_MAX = 8
+
 # Groq API configuration
 GROQ_API_BASE_URL = "https://api.groq.com/openai/v1"
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
@@ -35,27 +101,98 @@ SYSTEM_PROMPT = """SYSTEM: You are "Hotpin" — a compact, helpful, and privacy-
 4.  **VISION INTEGRATION:** When an image is provided, analyze it and incorporate visual insights into your concise response.
 5.  **CONTEXT AWARENESS:** Reference what you see in the image naturally within your single-sentence answer."""
 
+# Pre-built system message - constructed once at import instead of per call
+# so the hot path never rebuilds (and re-hashes) the ~1KB constant prompt
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
 
 def init_client() -> None:
     """
     Initialize the global httpx.AsyncClient for Groq API calls.
     Called during FastAPI startup event.
-    Uses connection pooling for efficient resource reuse.
+    Uses HTTP/2 with connection pooling so concurrent sessions multiplex
+    over a single TLS connection instead of opening one TCP+TLS handshake each.
     """
     global groq_client
-    
+
     if not GROQ_API_KEY or GROQ_API_KEY == "your_groq_api_key_here":
         raise ValueError("GROQ_API_KEY not set in .env file. Please add your API key.")
-    
+
     groq_client = httpx.AsyncClient(
         base_url=GROQ_API_BASE_URL,
         headers={
             "Authorization": f"Bearer {GROQ_API_KEY}",
             "Content-Type": "application/json"
         },
-        timeout=30.0  # 30 second timeout for LLM calls
+        timeout=httpx.Timeout(30.0, connect=5.0),  # 30s total, 5s connect
+        http2=True,  # Multiplex concurrent requests over one TLS stream
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=100,
+            keepalive_expiry=30
+        )
     )
-    print(f"Groq AsyncClient initialized with model: {GROQ_MODEL}")
+    print(f"Groq AsyncClient initialized with model: {GROQ_MODEL} (HTTP/2 enabled)")
+
+    # Start the idle-session reaper (init_client runs inside the FastAPI
+    # lifespan, so an event loop is guaranteed to be running here)
+    global _reaper_task
+    _reaper_task = asyncio.create_task(_session_reaper())
+
+
+async def _session_reaper(ttl_s: int = SESSION_TTL_SECONDS,
+                          interval_s: int = SESSION_REAPER_INTERVAL_SECONDS) -> None:
+    """
+    Periodically evict sessions idle longer than the TTL.
+
+    clear_session_context only fires on clean WebSocket disconnects, so
+    crashed or vanished clients would otherwise grow SESSION_CONTEXTS
+    without bound. This keeps process memory bounded under session churn.
+    """
+    while True:
+        await asyncio.sleep(interval_s)
+        now = time.time()
+        stale = [
+            sid for sid, ctx in SESSION_CONTEXTS.items()
+            if now - ctx["last_activity_ts"] > ttl_s
+        ]
+        for sid in stale:
+            SESSION_CONTEXTS.pop(sid, None)
+        if stale:
+            print(f"Session reaper evicted {len(stale)} idle session(s)")
+
+
+async def warmup_client() -> None:
+    """
+    Prime the Groq connection so the first utterance doesn't pay
+    DNS+TCP+TLS handshake latency (~200-500ms) on the critical path.
+    Called during FastAPI startup after init_client(). When
+    GROQ_KEEPALIVE_SECONDS is set, also starts a ping loop that keeps
+    the HTTP/2 connection warm between infrequent utterances.
+    """
+    global _keepalive_task
+
+    if not groq_client:
+        return
+
+    try:
+        await groq_client.get("/models", timeout=5.0)
+        print("✓ Groq connection pre-warmed")
+    except Exception as e:
+        print(f"⚠ Groq connection pre-warm failed (will connect on first request): {e}")
+
+    if GROQ_KEEPALIVE_SECONDS > 0:
+        _keepalive_task = asyncio.create_task(_keepalive_loop())
+
+
+async def _keepalive_loop() -> None:
+    """Periodically ping the API to keep the pooled connection alive."""
+    while True:
+        await asyncio.sleep(GROQ_KEEPALIVE_SECONDS)
+        try:
+            await groq_client.get("/models", timeout=5.0)
+        except Exception:
+            pass  # Next real request re-establishes the connection
 
 
 async def close_client() -> None:
@@ -64,7 +201,13 @@ async def close_client() -> None:
     Called during FastAPI shutdown event.
     Ensures proper cleanup of connections.
     """
-    global groq_client
+    global groq_client, _reaper_task, _keepalive_task
+    if _reaper_task:
+        _reaper_task.cancel()
+        _reaper_task = None
+    if _keepalive_task:
+        _keepalive_task.cancel()
+        _keepalive_task = None
     if groq_client:
         await groq_client.aclose()
         print("✓ Groq AsyncClient closed")
@@ -81,67 +224,107 @@ def manage_context(session_id: str, role: str, content: str, max_history_turns:
         max_history_turns: Maximum number of conversation turns to keep (default: 10)
     
     Maintains context window by keeping only the last N turns to prevent overflow.
+    The history is a bounded deque, so appends are O(1) and the oldest
+    messages are evicted automatically instead of re-slicing the list per turn.
     """
     if session_id not in SESSION_CONTEXTS:
+        # Each turn = user + assistant message pair
         SESSION_CONTEXTS[session_id] = {
-            "history": [],
+            "history": deque(maxlen=max_history_turns * 2),
             "last_activity_ts": time.time()
         }
-    
-    # Append new message
+
+    # Append new message (deque evicts the oldest entry when full)
     SESSION_CONTEXTS[session_id]["history"].append({
         "role": role,
         "content": content
     })
-    
+
     # Update timestamp
     SESSION_CONTEXTS[session_id]["last_activity_ts"] = time.time()
-    
-    # Enforce context window limit (keep last N turns)
-    # Each turn = user + assistant message pair
-    max_messages = max_history_turns * 2  # user + assistant per turn
-    if len(SESSION_CONTEXTS[session_id]["history"]) > max_messages:
-        # Keep only the most recent messages
-        SESSION_CONTEXTS[session_id]["history"] = SESSION_CONTEXTS[session_id]["history"][-max_messages:]
 
 
-async def get_llm_response(session_id: str, transcript: str, image_base64: Optional[str] = None) -> str:
+def _strip_images(history) -> List[dict]:
     """
-    Get LLM response from Groq API with conversation context and optional image.
-    
-    Args:
-        session_id: Unique session identifier
-        transcript: User's transcribed speech input
-        image_base64: Optional base64-encoded JPEG image for multimodal context
-    
-    Returns:
-        str: LLM-generated response text
-    
-    Raises:
-        Exception: If API call fails or client not initialized
+    Defensive filter that reduces any multimodal history entry to its text
+    part. Images must be single-shot: only manage_context with plain text
+    should ever write to SESSION_CONTEXTS, but if a multimodal message
+    slips in, this keeps the base64 payload from being resent every turn.
+    """
+    cleaned = []
+    for message in history:
+        content = message["content"]
+        if isinstance(content, list):
+            text = " ".join(
+                part.get("text", "") for part in content
+                if isinstance(part, dict) and part.get("type") == "text"
+            )
+            cleaned.append({"role": message["role"], "content": text})
+        else:
+            cleaned.append(message)
+    return cleaned
+
+
+def _prepare_image(image_base64: str) -> str:
+    """
+    Downscale an oversized base64 JPEG before sending it to the API.
+
+    Images under the size threshold (or when Pillow is unavailable) pass
+    through unchanged. Resized results are cached by content hash so a
+    retried request doesn't repeat the decode/resize work.
+    """
+    if Image is None or len(image_base64) <= _IMAGE_RESIZE_THRESHOLD:
+        return image_base64
+
+    cache_key = hashlib.sha256(image_base64.encode()).hexdigest()
+    cached = _RESIZED_IMAGE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        image = Image.open(io.BytesIO(base64.b64decode(image_base64)))
+        image.thumbnail((_IMAGE_MAX_DIMENSION, _IMAGE_MAX_DIMENSION))
+        out = io.BytesIO()
+        image.convert("RGB").save(out, format="JPEG", quality=_IMAGE_JPEG_QUALITY)
+        resized = base64.b64encode(out.getvalue()).decode('utf-8')
+        print(f"🖼️ Downscaled image for LLM request: {len(image_base64)} -> {len(resized)} base64 chars")
+    except Exception as e:
+        print(f"⚠ Image downscale failed, sending original: {e}")
+        return image_base64
+
+    if len(_RESIZED_IMAGE_CACHE) >= _RESIZED_IMAGE_CACHE_MAX:
+        _RESIZED_IMAGE_CACHE.clear()
+    _RESIZED_IMAGE_CACHE[cache_key] = resized
+    return resized
+
+
+def _build_messages(session_id: str, transcript: str,
+                    image_base64: Optional[str] = None) -> List[dict]:
+    """
+    Construct the chat-completions messages list for the current turn.
+
+    Records the transcript in session context, prepends the system prompt
+    and prior history, and attaches the image (if any) only to the current
+    user message so it never persists into stored history.
     """
-    global groq_client
-    
-    if not groq_client:
-        raise RuntimeError("Groq client not initialized. Call init_client() first.")
-    
     # Add user message to context (store as text for history tracking)
     manage_context(session_id, "user", transcript)
-    
+
     # Retrieve conversation history
     history = SESSION_CONTEXTS[session_id]["history"]
-    
-    # Construct messages with system prompt
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT}
-    ]
-    
+
+    # Construct messages with the pre-built system prompt message
+    messages = [_SYSTEM_MESSAGE]
+
     # Add conversation history, but skip the last user message (we'll add it with image if needed)
+    # Prior turns are always text-only: images ride along on the current
+    # request exactly once and never persist into resent history
     if len(history) > 1:
-        messages.extend(history[:-1])
-    
+        messages.extend(_strip_images(itertools.islice(history, len(history) - 1)))
+
     # Construct the current user message with optional image
     if image_base64:
+        image_base64 = _prepare_image(image_base64)
         # Multimodal message format with text and image
         user_message_content = [
             {
@@ -159,13 +342,101 @@ async def get_llm_response(session_id: str, transcript: str, image_base64: Optio
     else:
         # Text-only message - use simple string format
         user_message_content = transcript
-    
+
     # Add current user message (multimodal or text-only)
     messages.append({
         "role": "user",
         "content": user_message_content
     })
-    
+
+    return messages
+
+
+async def stream_llm_response(session_id: str, transcript: str,
+                              image_base64: Optional[str] = None):
+    """
+    Stream LLM response deltas from Groq API as they are generated.
+
+    Async generator yielding content fragments (str) so the TTS pipeline
+    can start synthesizing the first sentence while later tokens are still
+    decoding, instead of idling until the full completion arrives.
+
+    Args:
+        session_id: Unique session identifier
+        transcript: User's transcribed speech input
+        image_base64: Optional base64-encoded JPEG image for multimodal context
+
+    Yields:
+        str: Incremental content deltas
+
+    Raises:
+        Exception: If the API call fails or the client is not initialized
+    """
+    global groq_client
+
+    if not groq_client:
+        raise RuntimeError("Groq client not initialized. Call init_client() first.")
+
+    messages = _build_messages(session_id, transcript, image_base64)
+
+    payload = {
+        "model": GROQ_MODEL,
+        "messages": messages,
+        "temperature": 0.2,
+        "max_tokens": 100,
+        "top_p": 0.9,
+        "stream": True
+    }
+
+    chunks: List[str] = []
+    async with _llm_semaphore:
+        async with groq_client.stream("POST", "/chat/completions",
+                                      content=_json_dumps_bytes(payload)) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # Server-sent events: each payload line is "data: {...}"
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                event = _json_loads(data)
+                choices = event.get("choices")
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content", "")
+                if delta:
+                    chunks.append(delta)
+                    yield delta
+
+    # Record the full assistant response in context once streaming completes
+    assistant_message = "".join(chunks)
+    if assistant_message.strip():
+        manage_context(session_id, "assistant", assistant_message)
+
+
+async def get_llm_response(session_id: str, transcript: str, image_base64: Optional[str] = None) -> str:
+    """
+    Get LLM response from Groq API with conversation context and optional image.
+
+    Args:
+        session_id: Unique session identifier
+        transcript: User's transcribed speech input
+        image_base64: Optional base64-encoded JPEG image for multimodal context
+
+    Returns:
+        str: LLM-generated response text
+
+    Raises:
+        Exception: If API call fails or client not initialized
+    """
+    global groq_client
+
+    if not groq_client:
+        raise RuntimeError("Groq client not initialized. Call init_client() first.")
+
+    messages = _build_messages(session_id, transcript, image_base64)
+
     payload = {
         "model": GROQ_MODEL,
         "messages": messages,
@@ -182,15 +453,24 @@ async def get_llm_response(session_id: str, transcript: str, image_base64: Optio
         print(f"   Last message has image: {isinstance(messages[-1]['content'], list)}")
     
     try:
-        # Make async API call to Groq
-        response = await groq_client.post(
-            "/chat/completions",
-            json=payload
-        )
+        # Make async API call to Groq, gated by the in-flight semaphore.
+        # Transient failures (429/5xx) are retried with exponential backoff.
+        async with _llm_semaphore:
+            for attempt in range(_MAX_RETRIES + 1):
+                response = await groq_client.post(
+                    "/chat/completions",
+                    content=_json_dumps_bytes(payload)
+                )
+                if response.status_code in _RETRYABLE_STATUS and attempt < _MAX_RETRIES:
+                    backoff = 0.5 * (2 ** attempt)
+                    print(f"⚠ Groq API returned {response.status_code}, retrying in {backoff:.1f}s")
+                    await asyncio.sleep(backoff)
+                    continue
+                break
         response.raise_for_status()
         
         # Parse response
-        response_data = response.json()
+        response_data = _json_loads(response.content)
         
         # Validate API response structure
         if "choices" not in response_data or len(response_data["choices"]) == 0:
@@ -230,6 +510,26 @@ async def get_llm_response(session_id: str, transcript: str, image_base64: Optio
         return "An error occurred. Please try again."
 
 
+async def get_llm_responses(requests: List[tuple]) -> List[str]:
+    """
+    Fan out several independent LLM requests concurrently.
+
+    Intended for non-interactive work (background summarization, vision
+    captioning) where several sessions' requests arrive together. The
+    chat-completions API has no true multi-prompt batching, so controlled
+    parallelism is the batch mechanism: each call runs under the shared
+    in-flight semaphore and multiplexes over the HTTP/2 connection.
+
+    Args:
+        requests: List of (session_id, transcript) or
+                  (session_id, transcript, image_base64) tuples
+
+    Returns:
+        List[str]: Responses in the same order as the requests
+    """
+    return await asyncio.gather(*(get_llm_response(*req) for req in requests))
+
+
 def get_session_context(session_id: str) -> Optional[dict]:
     """
     Retrieve session context for debugging or monitoring.
@@ -240,7 +540,14 @@ def get_session_context(session_id: str) -> Optional[dict]:
     Returns:
         dict or None: Session context with history and metadata
     """
-    return SESSION_CONTEXTS.get(session_id)
+    context = SESSION_CONTEXTS.get(session_id)
+    if context is None:
+        return None
+    # Cast the deque to a list so callers can JSON-serialize the history
+    return {
+        "history": list(context["history"]),
+        "last_activity_ts": context["last_activity_ts"]
+    }
 
 
 def clear_session_context(session_id: str) -> None:
@@ -7,9 +7,18 @@ import os
 import wave
 import io
 import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
 from vosk import Model, KaldiRecognizer
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Faster JSON on the hot path; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -17,6 +26,149 @@ load_dotenv()
 VOSK_MODEL = None
 VOSK_MODEL_PATH = os.getenv("VOSK_MODEL_PATH", "./model")
 
+# Fixed audio pipeline format (16-bit, 16kHz, mono PCM)
+SAMPLE_RATE = 16000
+CHANNELS = 1
+SAMPLE_WIDTH = 2
+
+# Dedicated executor for blocking STT work. Transcription is CPU-bound,
+# so the pool is sized to the machine rather than sharing asyncio's
+# default executor where it would queue behind other blocking calls.
+STT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("HOTPIN_STT_THREADS", os.cpu_count() or 2)),
+    thread_name_prefix="stt"
+)
+
+# Per-session recognizer cache. A wearable session produces many short
+# utterances; constructing a fresh KaldiRecognizer per utterance redoes
+# model attachment every time. One recognizer per session is reused with
+# Reset() between utterances. Guarded by a lock since calls arrive from
+# the STT thread pool.
+_SESSION_RECOGNIZERS: Dict[str, KaldiRecognizer] = {}
+_recognizers_lock = threading.Lock()
+
+
+def _get_session_recognizer(session_id: str, reset: bool = True) -> KaldiRecognizer:
+    """
+    Return the session's cached recognizer, creating it on first use.
+    With reset=True (batch transcription) a reused recognizer is cleared;
+    the streaming path passes reset=False to keep partial decode state.
+    """
+    with _recognizers_lock:
+        recognizer = _SESSION_RECOGNIZERS.get(session_id)
+        if recognizer is None:
+            recognizer = KaldiRecognizer(VOSK_MODEL, SAMPLE_RATE)
+            _SESSION_RECOGNIZERS[session_id] = recognizer
+        elif reset:
+            recognizer.Reset()
+    return recognizer
+
+
+def release_session_recognizer(session_id: str) -> None:
+    """
+    Drop the cached recognizer for a session.
+    Called from the WebSocket cleanup path on disconnect.
+    """
+    with _recognizers_lock:
+        _SESSION_RECOGNIZERS.pop(session_id, None)
+
+
+async def transcribe_audio(session_id: str, pcm_bytes: bytes) -> str:
+    """
+    Async wrapper running process_audio_for_transcription on the dedicated
+    STT executor, keeping the event loop free during Vosk decoding.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        STT_EXECUTOR, process_audio_for_transcription, session_id, pcm_bytes
+    )
+
+
+def shutdown_stt_executor() -> None:
+    """Shut down the STT thread pool. Called at application shutdown."""
+    STT_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+# --- Streaming transcription API ---------------------------------------
+# KaldiRecognizer is built for incremental feeding: pushing each captured
+# chunk as it arrives lets decoding overlap capture, so at end-of-speech
+# only FinalResult() remains instead of a full-utterance decode. The
+# WebSocket handler awaits each feed in arrival order, which keeps chunks
+# ordered without extra locking.
+
+
+async def create_session_recognizer(session_id: str) -> None:
+    """
+    Pre-build the session's recognizer on the STT pool. Called at
+    handshake so model binding overlaps the client's first audio frames
+    instead of delaying the first chunk fed to the recognizer.
+    """
+    await asyncio.get_running_loop().run_in_executor(
+        STT_EXECUTOR, _get_session_recognizer, session_id, False
+    )
+
+
+async def feed_audio(session_id: str, chunk: bytes) -> None:
+    """Feed one captured PCM chunk to the session's recognizer."""
+    await asyncio.get_running_loop().run_in_executor(
+        STT_EXECUTOR, _feed_chunk, session_id, chunk
+    )
+
+
+async def finalize_utterance(session_id: str) -> str:
+    """Flush the session's recognizer and return the final transcript."""
+    return await asyncio.get_running_loop().run_in_executor(
+        STT_EXECUTOR, _finalize_utterance, session_id
+    )
+
+
+async def discard_utterance(session_id: str) -> None:
+    """Drop any partially decoded audio for the session (RESET signal)."""
+    await asyncio.get_running_loop().run_in_executor(
+        STT_EXECUTOR, _discard_utterance, session_id
+    )
+
+
+def _feed_chunk(session_id: str, chunk: bytes) -> None:
+    """Blocking AcceptWaveform call for one streamed chunk."""
+    if VOSK_MODEL is None:
+        raise RuntimeError(
+            "Vosk model not initialized. Call initialize_vosk_model() first."
+        )
+    try:
+        recognizer = _get_session_recognizer(session_id, reset=False)
+        recognizer.AcceptWaveform(bytes(chunk))
+    except Exception as e:
+        print(f"Streaming STT feed error [{session_id}]: {e}")
+
+
+def _finalize_utterance(session_id: str) -> str:
+    """Blocking FinalResult + reset, leaving the recognizer reusable."""
+    try:
+        recognizer = _get_session_recognizer(session_id, reset=False)
+        raw_result = recognizer.FinalResult()
+        recognizer.Reset()
+        final_result = orjson.loads(raw_result) if orjson is not None else json.loads(raw_result)
+        transcript = final_result.get("text", "")
+
+        if transcript:
+            print(f"Transcription [{session_id}]: \"{transcript}\"")
+        else:
+            print(f"Empty transcription for session: {session_id}")
+
+        return transcript
+    except Exception as e:
+        print(f"Transcription error [{session_id}]: {e}")
+        # Return empty string on error so the conversation flow continues
+        return ""
+
+
+def _discard_utterance(session_id: str) -> None:
+    """Reset the session recognizer without producing a result."""
+    with _recognizers_lock:
+        recognizer = _SESSION_RECOGNIZERS.get(session_id)
+    if recognizer is not None:
+        recognizer.Reset()
+
 
 def initialize_vosk_model() -> None:
     """
@@ -79,71 +231,62 @@ def create_wav_header(pcm_data: bytes, sample_rate: int = 16000,
 def process_audio_for_transcription(session_id: str, pcm_bytes: bytes) -> str:
     """
     Perform synchronous speech-to-text transcription using Vosk.
-    
+
     This is a BLOCKING function executed in FastAPI's thread pool.
-    It encapsulates PCM audio data, initializes a Vosk recognizer,
-    and performs acoustic model inference to generate transcription.
-    
+    The raw PCM is fed directly to a Vosk recognizer - KaldiRecognizer
+    accepts headerless PCM at a known sample rate, so no WAV wrapping or
+    re-parsing is needed on the hot path.
+
     Args:
         session_id: Unique session identifier (for logging/debugging)
         pcm_bytes: Raw PCM audio data (16-bit, 16kHz, mono)
-    
+
     Returns:
         str: Transcribed text from the audio
-    
+
     Raises:
         RuntimeError: If Vosk model is not initialized
         Exception: If transcription fails
     """
     global VOSK_MODEL
-    
+
     if VOSK_MODEL is None:
         raise RuntimeError(
             "Vosk model not initialized. Call initialize_vosk_model() first."
         )
-    
+
     try:
-        # Step 1: Convert raw PCM to WAV format with proper headers
-        wav_bytes = create_wav_header(pcm_bytes, sample_rate=16000, channels=1, sample_width=2)
-        
-        # Step 2: Create in-memory WAV stream for Vosk processing
-        wav_stream = io.BytesIO(wav_bytes)
-        
-        # Step 3: Open WAV stream and extract audio parameters
-        with wave.open(wav_stream, 'rb') as wf:
-            # Verify audio format matches expected parameters
-            if wf.getnchannels() != 1:
-                raise ValueError(f"Audio must be mono (1 channel), got {wf.getnchannels()}")
-            if wf.getsampwidth() != 2:
-                raise ValueError(f"Audio must be 16-bit (2 bytes), got {wf.getsampwidth()}")
-            if wf.getframerate() != 16000:
-                raise ValueError(f"Audio must be 16kHz, got {wf.getframerate()}")
-            
-            # Step 4: Initialize Vosk KaldiRecognizer for this audio stream
-            # Sample rate must match the audio file
-            recognizer = KaldiRecognizer(VOSK_MODEL, wf.getframerate())
-            
-            # Step 5: Process audio data in chunks (blocking operation)
-            while True:
-                # Read 4000 bytes at a time (0.125 seconds at 16kHz)
-                data = wf.readframes(4000)
-                if len(data) == 0:
-                    break
-                
-                # Feed audio data to recognizer
-                recognizer.AcceptWaveform(data)
-            
-            # Step 6: Get final transcription result
-            final_result = json.loads(recognizer.FinalResult())
-            transcript = final_result.get("text", "")
-            
-            if transcript:
-                print(f"Transcription [{session_id}]: \"{transcript}\"")
-            else:
-                print(f"Empty transcription for session: {session_id}")
-            
-            return transcript
-    
+        # Verify audio shape: 16-bit samples mean the byte count must be even
+        if len(pcm_bytes) % SAMPLE_WIDTH != 0:
+            raise ValueError(
+                f"PCM data length must be a multiple of {SAMPLE_WIDTH} bytes "
+                f"(16-bit samples), got {len(pcm_bytes)}"
+            )
+
+        # Reuse the session's recognizer (reset between utterances)
+        recognizer = _get_session_recognizer(session_id)
+
+        # Feed raw PCM in chunks (blocking operation). Iterating a
+        # memoryview keeps this zero-copy for bytes-like inputs until the
+        # final bytes() handoff Vosk requires, and 32000-byte chunks (1s
+        # of audio) keep Python-to-C boundary crossings low.
+        mv = memoryview(pcm_bytes)
+        chunk_size = 32000
+        for offset in range(0, len(mv), chunk_size):
+            recognizer.AcceptWaveform(bytes(mv[offset:offset + chunk_size]))
+
+        # Get final transcription result
+        raw_result = recognizer.FinalResult()
+        final_result = orjson.loads(raw_result) if orjson is not None else json.loads(raw_result)
+        transcript = final_result.get("text", "")
+
+        if transcript:
+            print(f"Transcription [{session_id}]: \"{transcript}\"")
+        else:
+            print(f"Empty transcription for session: {session_id}")
+
+        return transcript
+
     except Exception as e:
         print(f"Transcription error [{session_id}]: {e}")
         # Return empty string on error rather than raising
@@ -161,7 +304,7 @@ def get_model_info() -> dict:
     return {
         "model_path": VOSK_MODEL_PATH,
         "model_loaded": VOSK_MODEL is not None,
-        "sample_rate": 16000,
-        "channels": 1,
-        "sample_width": 2
+        "sample_rate": SAMPLE_RATE,
+        "channels": CHANNELS,
+        "sample_width": SAMPLE_WIDTH
     }
@@ -7,26 +7,356 @@ normalizing output to the ESP32's 16 kHz mono PCM requirement.
 import os
 import io
 import wave
+import atexit
+import struct
+import asyncio
+import hashlib
+import logging
 import tempfile
+import threading
 import pyttsx3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from fractions import Fraction
+from functools import lru_cache
 from typing import Optional
 
 try:
-    import audioop  # type: ignore[import]
-except ImportError as exc:
-    raise RuntimeError("Python standard library module 'audioop' is required for TTS resampling") from exc
+    import audioop  # type: ignore[import]  # Removed in Python 3.13
+except ImportError:
+    audioop = None
+
+try:
+    import numpy as np  # Optional - vectorized audio normalization
+except ImportError:
+    np = None
+
+try:
+    from scipy import signal as scipy_signal  # Optional - polyphase resampling
+except ImportError:
+    scipy_signal = None
+
+if audioop is None and (np is None or scipy_signal is None):
+    raise RuntimeError(
+        "TTS resampling requires either the stdlib 'audioop' module "
+        "(removed in Python 3.13) or numpy+scipy"
+    )
+
+try:
+    from piper import PiperVoice  # Optional - persistent in-process neural TTS
+except ImportError:
+    PiperVoice = None
+
+# Module logger: per-request chatter goes to DEBUG so production
+# deployments (WARNING and up) pay no formatting or stdout-lock cost on
+# the synthesis hot path
+log = logging.getLogger("hotpin.tts")
 
 # TTS engine configuration
 DEFAULT_RATE = 175  # Words per minute (moderate speed for clarity)
 
+# Optional Piper backend: set PIPER_MODEL_PATH to an .onnx voice model to
+# synthesize with a long-lived in-process model instead of pyttsx3. Avoids
+# per-call engine bring-up and the temp-file round-trip entirely.
+PIPER_MODEL_PATH = os.getenv("PIPER_MODEL_PATH")
+_piper_voice = None
+_piper_lock = threading.Lock()
+
+# Directory for pyttsx3's intermediate WAV files. Prefer a RAM-backed
+# mount (tmpfs) on Linux so the per-call temp file never hits a block
+# device; overridable via TTS_TMPDIR for other RAM-disk setups.
+TTS_TMPDIR = os.getenv("TTS_TMPDIR") or (
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+)
+
+# Per-thread pyttsx3 engines. Engine construction (SAPI5 COM init,
+# espeak setup) costs hundreds of ms and is unrelated to text length,
+# so each worker thread builds one engine and reuses it across calls.
+_tls = threading.local()
+_all_engines = []
+_engines_lock = threading.Lock()
+
+
+def _get_engine():
+    """Return this thread's cached pyttsx3 engine, creating it on first use."""
+    engine = getattr(_tls, "engine", None)
+    if engine is None:
+        engine = pyttsx3.init()
+        engine.setProperty('rate', DEFAULT_RATE)
+        _tls.engine = engine
+        with _engines_lock:
+            _all_engines.append(engine)
+    return engine
+
+
+def shutdown_engines() -> None:
+    """Stop all cached pyttsx3 engines. Called at application shutdown."""
+    with _engines_lock:
+        for engine in _all_engines:
+            try:
+                engine.stop()
+            except Exception:
+                pass
+        _all_engines.clear()
+
+
+atexit.register(shutdown_engines)
+
+# Dedicated executor for blocking TTS work. Kept small and separate from
+# the STT pool so synthesis jobs never starve behind queued transcriptions
+# (or vice versa) in asyncio's shared default executor.
+TTS_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("HOTPIN_TTS_THREADS", 2)),
+    thread_name_prefix="tts"
+)
+
+
+async def synthesize_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
+    """
+    Async wrapper running synthesize_response_audio on the dedicated TTS
+    executor, keeping the event loop free during synthesis.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        TTS_EXECUTOR, synthesize_response_audio, text, rate
+    )
+
+
+async def synthesize_pcm(text: str, rate: int = DEFAULT_RATE) -> bytes:
+    """
+    Async wrapper running synthesize_response_pcm on the dedicated TTS
+    executor. Used by the streaming pipeline, which synthesizes sentence
+    by sentence and needs headerless PCM it can concatenate into one WAV.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        TTS_EXECUTOR, synthesize_response_pcm, text, rate
+    )
+
+
+def shutdown_tts_executor() -> None:
+    """Shut down the TTS thread pool. Called at application shutdown."""
+    TTS_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+# Optional process-pool backend for pyttsx3. Per-thread engines already
+# run espeak/NSSpeech in parallel, but SAPI5's runAndWait() serializes
+# across the whole process - set HOTPIN_TTS_WORKERS > 0 to move synthesis
+# into N persistent worker processes, each owning its own cached engine.
+TTS_PROCESS_WORKERS = int(os.getenv("HOTPIN_TTS_WORKERS", 0))
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _process_worker_init() -> None:
+    """Warm a worker process: build its engine before the first job."""
+    _get_engine()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared TTS process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=TTS_PROCESS_WORKERS,
+                    initializer=_process_worker_init
+                )
+    return _process_pool
+
+
+def _run_synthesis(text: str, rate: int) -> bytes:
+    """
+    Dispatch one synthesis job to the configured backend: the process
+    pool when HOTPIN_TTS_WORKERS is set, otherwise in the calling thread.
+    """
+    if TTS_PROCESS_WORKERS > 0:
+        return _get_process_pool().submit(_synthesize, text, rate).result()
+    return _synthesize(text, rate)
+
 TARGET_SAMPLE_RATE = 16000  # Fixed 16 kHz to match ESP32 voice pipeline
 TARGET_SAMPLE_WIDTH = 2     # 16-bit PCM
 TARGET_CHANNELS = 1         # Mono playback
 
 
+# Canonical 44-byte RIFF header layout: RIFF/WAVE ids, "fmt " chunk
+# (PCM format, channels, rates, block align, bit depth), then the id of
+# the chunk that follows the fmt block
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4s')
+
+
+def _already_target_format(wav_bytes: bytes) -> bool:
+    """
+    Check whether a WAV is already 16 kHz mono 16-bit PCM by parsing just
+    the canonical header, so matching audio can skip the full decode and
+    re-encode passes entirely.
+    """
+    if len(wav_bytes) < _WAV_HEADER.size:
+        return False
+    (riff_id, _, wave_id, fmt_id, fmt_size, audio_format, channels,
+     sample_rate, _, _, bits_per_sample, next_chunk_id) = _WAV_HEADER.unpack_from(wav_bytes)
+    return (
+        riff_id == b'RIFF'
+        and wave_id == b'WAVE'
+        and fmt_id == b'fmt '
+        and fmt_size == 16              # canonical PCM fmt chunk, no extensions
+        and audio_format == 1           # uncompressed PCM
+        and channels == TARGET_CHANNELS
+        and sample_rate == TARGET_SAMPLE_RATE
+        and bits_per_sample == TARGET_SAMPLE_WIDTH * 8
+        and next_chunk_id == b'data'    # data follows immediately - no extra chunks
+    )
+
+
+# Canonical 44-byte RIFF header for 16 kHz mono 16-bit PCM, built once
+# with zeroed length fields. The output format never changes at runtime,
+# so per-response header construction is two pack_into patches on a copy
+# of this template rather than a full struct.pack of all 13 fields.
+_WAV_HEADER_TEMPLATE = struct.pack(
+    '<4sI4s4sIHHIIHH4sI',
+    b'RIFF', 0, b'WAVE',
+    b'fmt ', 16, 1, TARGET_CHANNELS, TARGET_SAMPLE_RATE,
+    TARGET_SAMPLE_RATE * TARGET_CHANNELS * TARGET_SAMPLE_WIDTH,
+    TARGET_CHANNELS * TARGET_SAMPLE_WIDTH, TARGET_SAMPLE_WIDTH * 8,
+    b'data', 0
+)
+
+
+def build_wav_header(data_len: int) -> bytes:
+    """Return the canonical RIFF header with the length fields patched in."""
+    header = bytearray(_WAV_HEADER_TEMPLATE)
+    struct.pack_into('<I', header, 4, 36 + data_len)
+    struct.pack_into('<I', header, 40, data_len)
+    return bytes(header)
+
+
+def _build_wav(frames: bytes) -> bytes:
+    """
+    Prepend the canonical 44-byte RIFF header for 16 kHz mono 16-bit PCM.
+
+    One header patch plus a single known-size concatenation, instead of
+    the BytesIO + wave.open writer whose getvalue() re-copies the whole
+    PCM stream.
+    """
+    return build_wav_header(len(frames)) + frames
+
+
+def _decode_to_int16(frames: bytes, channels: int, sample_width: int) -> "np.ndarray":
+    """
+    Decode PCM frames to a mono int16 sample array (NumPy path).
+
+    Stereo downmix is one reshaped add+shift, width conversion a
+    cast+shift - each a single vectorized pass over the buffer.
+    """
+    if sample_width == 1:
+        # WAV stores 8-bit audio unsigned; re-center then scale up
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128) << 8
+    elif sample_width == 2:
+        samples = np.frombuffer(frames, dtype=np.int16)
+    elif sample_width == 4:
+        samples = (np.frombuffer(frames, dtype=np.int32) >> 16).astype(np.int16)
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    if channels == 2:
+        # Average interleaved L/R pairs in int32 to avoid overflow
+        samples = (samples.reshape(-1, 2).astype(np.int32).sum(axis=1) >> 1).astype(np.int16)
+
+    return samples
+
+
+def _downmix_and_widen(frames: bytes, channels: int, sample_width: int) -> bytes:
+    """
+    Convert PCM frames to mono 16-bit samples.
+
+    Uses the vectorized NumPy decode when available; falls back to the
+    scalar audioop loops otherwise.
+    """
+    if channels not in (1, 2):
+        raise ValueError(f"Unsupported channel count: {channels}")
+
+    if np is None:
+        if channels == 2:
+            frames = audioop.tomono(frames, sample_width, 0.5, 0.5)
+        if sample_width != TARGET_SAMPLE_WIDTH:
+            frames = audioop.lin2lin(frames, sample_width, TARGET_SAMPLE_WIDTH)
+        return frames
+
+    return _decode_to_int16(frames, channels, sample_width).tobytes()
+
+
+@lru_cache(maxsize=8)
+def _resample_ratio(sample_rate: int) -> tuple:
+    """Integer up/down factors for converting sample_rate to 16 kHz."""
+    ratio = Fraction(TARGET_SAMPLE_RATE, sample_rate).limit_denominator(1000)
+    return ratio.numerator, ratio.denominator
+
+
+def _design_polyphase(sample_rate: int) -> tuple:
+    """
+    Design the FIR kernel for resampling sample_rate to 16 kHz, matching
+    resample_poly's own firwin low-pass design (resample_poly applies the
+    up-factor gain itself). Returns (up, down, float32 taps).
+    """
+    up, down = _resample_ratio(sample_rate)
+    max_rate = max(up, down)
+    taps = scipy_signal.firwin(
+        2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 8.0)
+    )
+    return up, down, taps.astype(np.float32)
+
+
+# TTS backends overwhelmingly emit one of a handful of rates; design the
+# polyphase kernels for those once at import so the hot path never pays
+# for on-demand filter design. Other rates fall back to designing inline.
+_POLY_KERNELS = (
+    {rate: _design_polyphase(rate) for rate in (22050, 24000, 44100, 48000)}
+    if np is not None and scipy_signal is not None else {}
+)
+
+
+def _resample_frames(frames: bytes, sample_rate: int) -> bytes:
+    """
+    Resample 16-bit mono PCM to the 16 kHz target rate.
+
+    Prefers scipy's polyphase resampler (vectorized FIR, better quality
+    than linear interpolation) with kernels precomputed for the common
+    engine output rates; falls back to audioop.ratecv when numpy/scipy
+    are unavailable.
+    """
+    if np is not None and scipy_signal is not None:
+        samples = np.frombuffer(frames, dtype=np.int16)
+        return _resample_int16(samples, sample_rate).tobytes()
+
+    frames, _ = audioop.ratecv(frames, TARGET_SAMPLE_WIDTH, TARGET_CHANNELS,
+                               sample_rate, TARGET_SAMPLE_RATE, None)
+    return frames
+
+
+def _resample_int16(samples: "np.ndarray", sample_rate: int) -> "np.ndarray":
+    """Polyphase-resample an int16 sample array to 16 kHz int16."""
+    entry = _POLY_KERNELS.get(sample_rate)
+    as_f32 = samples.astype(np.float32)
+    if entry is not None:
+        up, down, taps = entry
+        resampled = scipy_signal.resample_poly(as_f32, up, down, window=taps)
+    else:
+        up, down = _resample_ratio(sample_rate)
+        resampled = scipy_signal.resample_poly(as_f32, up, down, window=('kaiser', 8.0))
+    return np.clip(resampled, -32768, 32767).astype(np.int16)
+
+
 def _ensure_pcm_format(wav_bytes: bytes) -> bytes:
     """Normalize synthesized audio to 16 kHz, mono, 16-bit PCM."""
 
+    # Fast path: when the engine already emitted the target format
+    # (common with espeak and tunable on SAPI5), a single header parse
+    # replaces two full WAV decode/encode passes
+    if _already_target_format(wav_bytes):
+        return wav_bytes
+
     try:
         with wave.open(io.BytesIO(wav_bytes), "rb") as wav_in:
             params = wav_in.getparams()
@@ -38,59 +368,161 @@ def _ensure_pcm_format(wav_bytes: bytes) -> bytes:
     channels = params.nchannels
     sample_rate = params.framerate
 
-    # Convert channels to mono if needed
-    if channels > TARGET_CHANNELS:
-        if channels != 2:
-            raise ValueError(f"Unsupported channel count: {channels}")
-        frames = audioop.tomono(frames, sample_width, 0.5, 0.5)
-        channels = 1
+    if channels not in (1, 2):
+        raise ValueError(f"Unsupported channel count: {channels}")
+
+    # Fused NumPy path: decode, downmix and resample stay in ndarray form
+    # end to end, so the PCM buffer is never serialized back to bytes
+    # between stages
+    if np is not None and scipy_signal is not None:
+        samples = _decode_to_int16(frames, channels, sample_width)
+        if sample_rate != TARGET_SAMPLE_RATE:
+            samples = _resample_int16(samples, sample_rate)
+        return _build_wav(samples.tobytes())
 
-    # Ensure 16-bit samples
-    if sample_width != TARGET_SAMPLE_WIDTH:
-        frames = audioop.lin2lin(frames, sample_width, TARGET_SAMPLE_WIDTH)
-        sample_width = TARGET_SAMPLE_WIDTH
+    # audioop fallback: stage-by-stage over bytes
+    if channels != TARGET_CHANNELS or sample_width != TARGET_SAMPLE_WIDTH:
+        frames = _downmix_and_widen(frames, channels, sample_width)
 
-    # Resample to target rate if needed
     if sample_rate != TARGET_SAMPLE_RATE:
-        frames, _ = audioop.ratecv(frames, sample_width, channels,
-                                   sample_rate, TARGET_SAMPLE_RATE, None)
-        sample_rate = TARGET_SAMPLE_RATE
+        frames = _resample_frames(frames, sample_rate)
+
+    return _build_wav(frames)
 
-    if channels != TARGET_CHANNELS or sample_width != TARGET_SAMPLE_WIDTH or sample_rate != TARGET_SAMPLE_RATE:
-        raise ValueError("Failed to normalize WAV format")
 
+def _get_piper_voice():
+    """Load the Piper voice model once and reuse it across calls."""
+    global _piper_voice
+    if _piper_voice is None:
+        with _piper_lock:
+            if _piper_voice is None:
+                log.info("Loading Piper voice model: %s", PIPER_MODEL_PATH)
+                _piper_voice = PiperVoice.load(PIPER_MODEL_PATH)
+    return _piper_voice
+
+
+def _synthesize_with_piper(text: str) -> bytes:
+    """
+    Generate speech audio entirely in memory with the persistent Piper voice.
+
+    No engine re-initialization and no temp-file I/O per call - the model
+    writes WAV frames straight into a BytesIO, which is then normalized to
+    the device PCM format.
+    """
     buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_out:
-        wav_out.setnchannels(TARGET_CHANNELS)
-        wav_out.setsampwidth(TARGET_SAMPLE_WIDTH)
-        wav_out.setframerate(TARGET_SAMPLE_RATE)
-        wav_out.writeframes(frames)
+    with wave.open(buffer, 'wb') as wav_file:
+        _get_piper_voice().synthesize(text, wav_file)
+    return _ensure_pcm_format(buffer.getvalue())
 
-    return buffer.getvalue()
+
+# Short confirmation phrases recur across sessions ("Capturing image
+# now.", "Recording stopped.", ...). Replies at or under this length are
+# served from an LRU cache so repeated phrases skip synthesis entirely;
+# longer responses stay uncached to bound memory.
+CACHEABLE_TEXT_MAX_CHARS = 200
+
+
+def build_wav_bytes(pcm_frames: bytes) -> bytes:
+    """Wrap raw 16 kHz mono 16-bit PCM frames in a single canonical WAV."""
+    return _build_wav(pcm_frames)
+
+
+def synthesize_response_pcm(text: str, rate: int = DEFAULT_RATE) -> bytes:
+    """
+    Synthesize text and return raw PCM frames without a WAV header.
+
+    The device protocol requires exactly one WAV header per response, so
+    per-sentence synthesis yields headerless PCM that the caller joins
+    and wraps once with build_wav_bytes.
+    """
+    wav_bytes = synthesize_response_audio(text, rate)
+    # Synthesis output always carries the canonical 44-byte header, so
+    # stripping it is a slice; fall back to a real parse just in case
+    if _already_target_format(wav_bytes):
+        return wav_bytes[44:]
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_in:
+        return wav_in.readframes(wav_in.getnframes())
 
 
 def synthesize_response_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
     """
-    Generate speech audio from text using pyttsx3.
-    
+    Generate speech audio from text.
+
     This is a BLOCKING function executed in FastAPI's thread pool.
-    pyttsx3 requires exclusive thread control during synthesis via runAndWait().
-    Uses temporary file I/O as pyttsx3 doesn't reliably support in-memory
-    byte output across all platform backends (SAPI5, nsss, espeak).
-    
+    Short phrases are served from an LRU cache keyed by normalized text;
+    cache misses (and long responses) run the configured synthesis backend
+    (Piper when configured, otherwise pyttsx3).
+
     Args:
         text: Text content to synthesize into speech
         rate: Speech rate in words per minute (default: 175)
-    
+
     Returns:
         bytes: Complete WAV audio file data normalized to 16 kHz mono PCM
-    
+
     Raises:
         ValueError: If input text is empty or whitespace only
         Exception: If synthesis fails or engine initialization fails
-    
-    Process:
-    1. Initialize pyttsx3 engine (platform-specific backend)
+    """
+    # Input validation - must be done BEFORE thread pool execution
+    if not text or text.strip() == "":
+        error_msg = "Cannot synthesize empty text. Provide non-empty string."
+        log.error("TTS input validation error: %s", error_msg)
+        raise ValueError(error_msg)
+
+    # Normalize whitespace - also the cache key, so "Done. " and "Done."
+    # share an entry. Case is preserved because it can affect pronunciation.
+    normalized = " ".join(text.split())
+
+    if len(normalized) <= CACHEABLE_TEXT_MAX_CHARS:
+        return _synthesize_cached(normalized, rate)
+    return _run_synthesis(normalized, rate)
+
+
+# Optional persistent phrase cache: point HOTPIN_TTS_CACHE_DIR at a
+# writable directory and short-phrase audio survives process restarts
+# as {sha256(rate:text)}.wav files under it
+TTS_CACHE_DIR = os.getenv("HOTPIN_TTS_CACHE_DIR")
+
+
+@lru_cache(maxsize=256)
+def _synthesize_cached(text: str, rate: int) -> bytes:
+    """LRU-cached synthesis for short, frequently repeated phrases."""
+    if not TTS_CACHE_DIR:
+        return _run_synthesis(text, rate)
+
+    digest = hashlib.sha256(f"{rate}:{text}".encode("utf-8")).hexdigest()
+    cache_path = os.path.join(TTS_CACHE_DIR, f"{digest}.wav")
+    try:
+        with open(cache_path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    wav_bytes = _run_synthesis(text, rate)
+    try:
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(wav_bytes)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning("Could not persist TTS cache entry %s: %s", cache_path, e)
+    return wav_bytes
+
+
+def _synthesize(text: str, rate: int) -> bytes:
+    """
+    Run the actual synthesis backend (Piper or pyttsx3).
+
+    pyttsx3 requires exclusive thread control during synthesis via
+    runAndWait() and uses temporary file I/O because it doesn't reliably
+    support in-memory byte output across platform backends (SAPI5, nsss,
+    espeak).
+
+    Process (pyttsx3 path):
+    1. Get this thread's cached engine (platform-specific backend)
     2. Configure speech properties (rate, voice)
     3. Generate unique temporary WAV file path
     4. Save synthesized speech to temp file
@@ -99,36 +531,35 @@ def synthesize_response_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
     7. Clean up temporary file
     8. Return audio bytes
     """
-    # Input validation - must be done BEFORE thread pool execution
-    if not text or text.strip() == "":
-        error_msg = "Cannot synthesize empty text. Provide non-empty string."
-        print(f"✗ TTS input validation error: {error_msg}")
-        raise ValueError(error_msg)
-    
-    # Sanitize text for TTS (remove problematic characters)
-    text = text.strip()
-    
+    # Prefer the persistent Piper backend when configured - it keeps the
+    # model loaded and never touches disk. Fall back to pyttsx3 on error.
+    if PiperVoice is not None and PIPER_MODEL_PATH:
+        try:
+            return _synthesize_with_piper(text)
+        except Exception as e:
+            log.warning("Piper synthesis failed, falling back to pyttsx3: %s", e)
+
     engine = None
     temp_fd = None
     temp_path = None
     
     try:
-        # Step 1: Initialize pyttsx3 engine
-        # This creates a platform-specific TTS engine instance
-        # Windows: SAPI5, macOS: NSSpeechSynthesizer, Linux: espeak
-        engine = pyttsx3.init()
-        
+        # Step 1: Get this thread's cached pyttsx3 engine
+        # (platform-specific backend: Windows SAPI5, macOS NSSpeechSynthesizer,
+        # Linux espeak - constructed once per worker thread, reused after)
+        engine = _get_engine()
+
         # Step 2: Configure speech properties
         engine.setProperty('rate', rate)  # Speech speed
-        
+
         # Optional: Set voice (can be customized for different languages/accents)
         # voices = engine.getProperty('voices')
         # engine.setProperty('voice', voices[0].id)  # Use first available voice
-        
+
         # Step 3: Create temporary file for WAV output
         # mkstemp returns (file_descriptor, file_path)
         # We need the path for pyttsx3 and will manage cleanup manually
-        temp_fd, temp_path = tempfile.mkstemp(suffix=".wav", prefix="hotpin_tts_")
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".wav", prefix="hotpin_tts_", dir=TTS_TMPDIR)
         
         # Close the file descriptor as pyttsx3 will handle file writing
         os.close(temp_fd)
@@ -142,9 +573,14 @@ def synthesize_response_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
         # and the WAV file has been written to disk
         engine.runAndWait()
         
-        # Step 6: Read synthesized audio bytes from temporary file
-        with open(temp_path, 'rb') as audio_file:
-            wav_bytes = audio_file.read()
+        # Step 6: Read synthesized audio bytes from temporary file.
+        # Sized single os.read skips the buffered-IO layer: one stat, one
+        # read syscall, one allocation for the whole file.
+        fd = os.open(temp_path, os.O_RDONLY)
+        try:
+            wav_bytes = os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
         
         # Verify we got valid audio data
         if len(wav_bytes) == 0:
@@ -153,27 +589,30 @@ def synthesize_response_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
         # Normalize to device-friendly PCM format
         wav_bytes = _ensure_pcm_format(wav_bytes)
         
-        print(f"TTS synthesis completed: {len(wav_bytes)} bytes generated")
+        log.debug("TTS synthesis completed: %d bytes generated", len(wav_bytes))
         
         return wav_bytes
     
     except ValueError as ve:
         # Re-raise validation errors with context
-        print(f"TTS validation error: {ve}")
+        log.error("TTS validation error: %s", ve)
         raise
-    
-    except Exception as e:
-        print(f"TTS synthesis error: {type(e).__name__}: {e}")
+
+    except Exception:
+        log.exception("TTS synthesis error")
         raise
     
     finally:
-        # Step 7: Cleanup - ensure temporary file is deleted
-        if temp_path and os.path.exists(temp_path):
+        # Step 7: Cleanup - unlink directly (EAFP) instead of stat-then-
+        # remove, halving the cleanup syscalls on every request
+        if temp_path:
             try:
-                os.remove(temp_path)
-                print(f"Cleaned up temp file: {temp_path}")
-            except Exception as cleanup_error:
-                print(f"Failed to cleanup temp file {temp_path}: {cleanup_error}")
+                os.unlink(temp_path)
+                log.debug("Cleaned up temp file: %s", temp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as cleanup_error:
+                log.warning("Failed to cleanup temp file %s: %s", temp_path, cleanup_error)
         
         # Close file descriptor if still open (edge case)
         if temp_fd is not None:
@@ -181,28 +620,33 @@ def synthesize_response_audio(text: str, rate: int = DEFAULT_RATE) -> bytes:
                 os.close(temp_fd)
             except:
                 pass
-        
-        # Stop the TTS engine
-        if engine:
-            try:
-                engine.stop()
-            except:
-                pass
+
+        # NOTE: The engine is deliberately NOT stopped here - it is cached
+        # per-thread and reused; shutdown_engines() handles final cleanup
+
+
+# Cached voice list - installed voices don't change at runtime, and
+# enumerating them re-initializes an engine on every call otherwise
+_voices_cache: Optional[list] = None
 
 
 def get_available_voices() -> list:
     """
     Get list of available TTS voices on the system.
     Useful for debugging and voice selection.
-    
+    The result is cached after the first successful enumeration.
+
     Returns:
         list: List of voice objects with id, name, and language info
     """
+    global _voices_cache
+    if _voices_cache is not None:
+        return _voices_cache
+
     try:
-        engine = pyttsx3.init()
+        engine = _get_engine()
         voices = engine.getProperty('voices')
-        engine.stop()
-        
+
         voice_info = []
         for voice in voices:
             voice_info.append({
@@ -210,11 +654,12 @@ def get_available_voices() -> list:
                 'name': voice.name,
                 'languages': voice.languages if hasattr(voice, 'languages') else []
             })
-        
+
+        _voices_cache = voice_info
         return voice_info
-    
+
     except Exception as e:
-        print(f"Error getting voices: {e}")
+        log.error("Error getting voices: %s", e)
         return []
 
 
@@ -229,8 +674,8 @@ def test_tts_engine() -> bool:
     try:
         engine = pyttsx3.init()
         engine.stop()
-        print("pyttsx3 TTS engine test successful")
+        log.info("pyttsx3 TTS engine test successful")
         return True
     except Exception as e:
-        print(f"pyttsx3 TTS engine test failed: {e}")
+        log.error("pyttsx3 TTS engine test failed: %s", e)
         return False
@@ -9,40 +9,58 @@ import sys
 import re
 from pathlib import Path
 
+# Mapping between .env keys and sdkconfig keys
+ENV_TO_CONFIG = {
+    'HOTPIN_SERVER_IP': 'CONFIG_HOTPIN_SERVER_IP',
+    'HOTPIN_SERVER_PORT': 'CONFIG_HOTPIN_SERVER_PORT',
+    'HOTPIN_WIFI_SSID': 'CONFIG_HOTPIN_WIFI_SSID',
+    'HOTPIN_WIFI_PASSWORD': 'CONFIG_HOTPIN_WIFI_PASSWORD',
+    'HOTPIN_SESSION_ID': 'CONFIG_HOTPIN_SESSION_ID',
+    'HOTPIN_AUTH_TOKEN': 'CONFIG_HOTPIN_AUTH_TOKEN'
+}
+CONFIG_TO_ENV = {config: env for env, config in ENV_TO_CONFIG.items()}
+
+# Single compiled alternation - one regex pass per line instead of one
+# freshly built re.match per managed key per line
+CONFIG_LINE_RE = re.compile(r'^(' + '|'.join(map(re.escape, ENV_TO_CONFIG.values())) + r')=')
+
+# One KEY=VALUE entry per line; comments are excluded by the lookahead
+# and quotes captured into their own alternatives so no post-hoc
+# stripping is needed
+ENV_LINE_RE = re.compile(
+    r'^(?![ \t]*#)[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*'
+    r'(?:"([^"]*)"|\'([^\']*)\'|([^\r\n]*?))[ \t]*$',
+    re.MULTILINE
+)
+
+def format_config_line(config_key, value):
+    """Format a sdkconfig line, quoting everything except numeric ports"""
+    if config_key.endswith('_PORT'):
+        # Port is a number
+        return f'{config_key}={value}\n'
+    # Everything else is a string
+    return f'{config_key}="{value}"\n'
+
 def load_env_file(env_path):
     """Load environment variables from .env file"""
-    env_vars = {}
-    
     if not os.path.exists(env_path):
         print(f"❌ Error: {env_path} not found!")
         print(f"💡 Tip: Copy .env.example to .env and edit the values")
         return None
-    
+
     print(f"📖 Reading configuration from: {env_path}")
-    
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                env_vars[key] = value
-                print(f"  ✓ {key}={value}")
-    
+
+    # One compiled-regex pass over the whole file instead of per-line
+    # strip/startswith/split/unquote in Python bytecode
+    text = Path(env_path).read_text(encoding='utf-8')
+    env_vars = {}
+    for match in ENV_LINE_RE.finditer(text):
+        key = match.group(1)
+        # Exactly one of the quoted/unquoted value groups matched
+        value = next(g for g in match.groups()[1:] if g is not None)
+        env_vars[key] = value
+        print(f"  ✓ {key}={value}")
+
     return env_vars
 
 def update_sdkconfig(sdkconfig_path, env_vars):
@@ -53,51 +71,37 @@ def update_sdkconfig(sdkconfig_path, env_vars):
         print(f"💡 Tip: Run 'idf.py menuconfig' first to generate sdkconfig")
         return False
     
-    # Mapping between .env keys and sdkconfig keys
-    mapping = {
-        'HOTPIN_SERVER_IP': 'CONFIG_HOTPIN_SERVER_IP',
-        'HOTPIN_SERVER_PORT': 'CONFIG_HOTPIN_SERVER_PORT',
-        'HOTPIN_WIFI_SSID': 'CONFIG_HOTPIN_WIFI_SSID',
-        'HOTPIN_WIFI_PASSWORD': 'CONFIG_HOTPIN_WIFI_PASSWORD',
-        'HOTPIN_SESSION_ID': 'CONFIG_HOTPIN_SESSION_ID',
-        'HOTPIN_AUTH_TOKEN': 'CONFIG_HOTPIN_AUTH_TOKEN'
-    }
-    
     print(f"\n📝 Updating: {sdkconfig_path}")
-    
-    # Read current sdkconfig
-    with open(sdkconfig_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
-    # Update values
+
+    # Stream line-by-line into a sibling temp file instead of buffering the
+    # whole sdkconfig in memory, then swap it into place atomically. Memory
+    # stays constant regardless of file size, and os.replace means a crash
+    # mid-write never leaves a half-written sdkconfig behind.
+    tmp_path = f"{sdkconfig_path}.tmp"
     updated_count = 0
-    for i, line in enumerate(lines):
-        for env_key, config_key in mapping.items():
-            if env_key not in env_vars:
-                continue
-            
-            # Match CONFIG_KEY=value or CONFIG_KEY="value"
-            pattern = f'^{config_key}='
-            if re.match(pattern, line):
-                value = env_vars[env_key]
-                
-                # Determine if value should be quoted
-                if config_key.endswith('_PORT'):
-                    # Port is a number
-                    new_line = f'{config_key}={value}\n'
-                else:
-                    # Everything else is a string
-                    new_line = f'{config_key}="{value}"\n'
-                
-                if lines[i] != new_line:
-                    lines[i] = new_line
-                    updated_count += 1
-                    print(f"  ✓ Updated {config_key}")
-    
-    # Write updated sdkconfig
-    with open(sdkconfig_path, 'w', encoding='utf-8') as f:
-        f.writelines(lines)
-    
+    try:
+        # 1 MiB output buffer: a typical sdkconfig flushes in one or two
+        # write() syscalls instead of one per 8 KiB default buffer fill
+        with open(sdkconfig_path, 'r', encoding='utf-8') as src, \
+             open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as dst:
+            for line in src:
+                match = CONFIG_LINE_RE.match(line)
+                if match:
+                    config_key = match.group(1)
+                    env_key = CONFIG_TO_ENV[config_key]
+                    if env_key in env_vars:
+                        new_line = format_config_line(config_key, env_vars[env_key])
+                        if line != new_line:
+                            line = new_line
+                            updated_count += 1
+                            print(f"  ✓ Updated {config_key}")
+                dst.write(line)
+        os.replace(tmp_path, sdkconfig_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
     if updated_count > 0:
         print(f"\n✅ Successfully updated {updated_count} configuration(s)")
         print(f"🔨 Next step: Run 'idf.py build' to rebuild with new settings")
@@ -4,30 +4,37 @@ Automatic Server IP Detection and Configuration Updater
 Detects the host PC's IP address and updates the ESP32 firmware .env file
 """
 
+import contextlib
+import functools
+import io
 import os
+import re
 import socket
 import subprocess
 import sys
 from pathlib import Path
 
+# First SSID line from `netsh wlan show interfaces` output (skips BSSID)
+_SSID_RE = re.compile(r'^\s*SSID\s*:\s*(.+)$', re.MULTILINE)
 
+
+@functools.lru_cache(maxsize=1)
 def get_local_ip():
     """
     Get the local IP address of this machine.
     Uses socket connection test to determine the active network interface IP.
+    Cached so repeat callers don't redo the routing-table probe.
     """
     try:
         # Create a socket and connect to a public DNS server
         # This doesn't actually send data, just determines which interface would be used
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.settimeout(0.1)
-        s.connect(("8.8.8.8", 80))
-        local_ip = s.getsockname()[0]
-        s.close()
-        return local_ip
+        with contextlib.closing(socket.socket(socket.AF_INET, socket.SOCK_DGRAM)) as s:
+            s.settimeout(0.1)
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
     except Exception as e:
         print(f"⚠️  Socket method failed: {e}")
-        
+
         # Fallback method
         try:
             hostname = socket.gethostname()
@@ -38,26 +45,28 @@ def get_local_ip():
             return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_wifi_ssid_windows():
     """
     Get the currently connected WiFi SSID on Windows.
+    Cached — the netsh subprocess is by far the most expensive call here.
     """
     try:
         result = subprocess.run(
             ['netsh', 'wlan', 'show', 'interfaces'],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=5,
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
         )
-        
+
         if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'SSID' in line and 'BSSID' not in line:
-                    ssid = line.split(':', 1)[1].strip()
-                    return ssid
+            match = _SSID_RE.search(result.stdout)
+            if match:
+                return match.group(1).strip()
     except Exception as e:
         print(f"⚠️  Could not detect WiFi SSID: {e}")
-    
+
     return None
 
 
@@ -74,34 +83,40 @@ def update_env_file(env_path, server_ip, wifi_ssid=None):
         print(f"❌ .env file not found: {env_path}")
         return False
     
-    # Read existing .env file
-    with open(env_path, 'r') as f:
-        lines = f.readlines()
-    
-    # Update lines
-    updated_lines = []
+    # Build the updated file in one contiguous StringIO buffer rather than
+    # a list of line objects, then swap it in atomically via a temp file
+    buf = io.StringIO()
     ip_updated = False
     ssid_updated = False
-    
-    for line in lines:
-        # Update server IP
-        if line.strip().startswith('HOTPIN_SERVER_IP='):
-            updated_lines.append(f'HOTPIN_SERVER_IP={server_ip}\n')
-            ip_updated = True
-            print(f'  ✓ Updated HOTPIN_SERVER_IP={server_ip}')
-        
-        # Update WiFi SSID if provided
-        elif wifi_ssid and line.strip().startswith('HOTPIN_WIFI_SSID='):
-            updated_lines.append(f'HOTPIN_WIFI_SSID={wifi_ssid}\n')
-            ssid_updated = True
-            print(f'  ✓ Updated HOTPIN_WIFI_SSID={wifi_ssid}')
-        
-        else:
-            updated_lines.append(line)
-    
-    # Write back to file
-    with open(env_path, 'w') as f:
-        f.writelines(updated_lines)
+
+    with open(env_path, 'r') as f:
+        for line in f:
+            # Update server IP
+            if line.strip().startswith('HOTPIN_SERVER_IP='):
+                buf.write(f'HOTPIN_SERVER_IP={server_ip}\n')
+                ip_updated = True
+                print(f'  ✓ Updated HOTPIN_SERVER_IP={server_ip}')
+
+            # Update WiFi SSID if provided
+            elif wifi_ssid and line.strip().startswith('HOTPIN_WIFI_SSID='):
+                buf.write(f'HOTPIN_WIFI_SSID={wifi_ssid}\n')
+                ssid_updated = True
+                print(f'  ✓ Updated HOTPIN_WIFI_SSID={wifi_ssid}')
+
+            else:
+                buf.write(line)
+
+    # Single write of the whole buffer, then an atomic rename so a crash
+    # mid-write never leaves a truncated .env behind
+    tmp_path = f'{env_path}.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(buf.getvalue())
+        os.replace(tmp_path, env_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
     
     if ip_updated:
         print(f"✅ Successfully updated .env file")
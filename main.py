@@ -10,49 +10,70 @@ Architecture:
 
 Concurrency Model:
 - Async: WebSocket I/O, Groq API calls
-- Sync (thread pool): Vosk transcription, pyttsx3 synthesis
+- Sync: Vosk transcription and pyttsx3 synthesis on dedicated bounded
+  executors (STT pool sized to CPUs, small TTS pool) so neither starves
+  the other or unrelated blocking work in asyncio's default executor
 """
 
 import os
-import io
+import re
 import json
+import traceback
+import queue
+import logging
+import logging.handlers
 import asyncio
 import socket
 import subprocess
 import base64
 from typing import Dict
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from dotenv import load_dotenv
 
-import nltk
+try:
+    import orjson  # Faster JSON for WebSocket frames; stdlib json is the fallback
+except ImportError:
+    orjson = None
 
-# Download NLTK data if not already present
 try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
+    import audioop  # type: ignore[import]  # Removed in Python 3.13
+except ImportError:
+    audioop = None
+
 try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+    import numpy as np  # Optional - vectorized silence detection
+except ImportError:
+    np = None
 
 # Import core modules
 from core.llm_client import (
-    init_client, 
-    close_client, 
-    get_llm_response,
+    init_client,
+    warmup_client,
+    close_client,
+    stream_llm_response,
+    get_session_context,
+    manage_context,
     clear_session_context
 )
 from core.stt_worker import (
     initialize_vosk_model,
-    process_audio_for_transcription,
+    create_session_recognizer,
+    feed_audio,
+    finalize_utterance,
+    discard_utterance,
+    release_session_recognizer,
+    shutdown_stt_executor,
     get_model_info
 )
 from core.tts_worker import (
-    synthesize_response_audio,
+    synthesize_audio,
+    synthesize_pcm,
+    build_wav_bytes,
+    shutdown_tts_executor,
     test_tts_engine,
     get_available_voices
 )
@@ -60,26 +81,217 @@ from core.tts_worker import (
 # Load environment variables
 load_dotenv()
 
-# In-memory session audio buffers
-# Maps session_id -> io.BytesIO buffer containing raw PCM audio
-SESSION_AUDIO_BUFFERS: Dict[str, io.BytesIO] = {}
+# All server logging funnels through a queue: the event loop only enqueues
+# records, while a QueueListener thread does the formatting and stdout
+# writes. Hot-path log calls no longer block on the stdout lock or flush.
+logger = logging.getLogger("hotpin.server")
+
+_LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_LOG_LISTENER: logging.handlers.QueueListener = None
+
+
+def setup_logging():
+    """Start queue-based logging; safe to call more than once."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        return
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(message)s"))
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+    _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, console)
+    _LOG_LISTENER.start()
+
+
+def shutdown_logging():
+    """Flush any queued records and stop the listener thread."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        _LOG_LISTENER = None
+
+class SessionState:
+    """
+    Per-session hot-path state: the audio buffer plus chunk telemetry.
+
+    __slots__ lays the fields out as C-level slot descriptors and
+    collapses the former buffer-dict + stats-dict pair into one object,
+    so the receive loop resolves a session with a single dict lookup.
+    """
+    __slots__ = ('buffer', 'chunks', 'bytes_received')
+
+    def __init__(self, buffer: bytearray):
+        self.buffer = buffer
+        self.chunks = 0
+        self.bytes_received = 0
+
 
-# Lightweight telemetry for debugging: tracks per-session audio chunks
-SESSION_AUDIO_STATS: Dict[str, Dict[str, int]] = {}
+# In-memory session state
+# Maps session_id -> SessionState with its reusable PCM bytearray
+SESSIONS: Dict[str, SessionState] = {}
+
+# Pool of recycled audio buffers. Sessions churn, but their buffers are
+# interchangeable - reusing them avoids re-growing a fresh allocation
+# chunk by chunk for every connection.
+_AUDIO_BUFFER_POOL: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+
+
+def acquire_audio_buffer() -> bytearray:
+    """Take a cleared buffer from the pool, or allocate a new one."""
+    try:
+        return _AUDIO_BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return bytearray()
+
+
+def release_audio_buffer(buffer: bytearray) -> None:
+    """Clear a session buffer and return it to the pool."""
+    try:
+        del buffer[:]
+    except BufferError:
+        # An in-flight memoryview still pins the buffer; just drop it
+        return
+    _AUDIO_BUFFER_POOL.put(buffer)
+
+
+def _reset_session_buffer(session_id: str) -> None:
+    """Empty the session's audio buffer and stats for the next utterance."""
+    state = SESSIONS.get(session_id)
+    if state is None:
+        SESSIONS[session_id] = SessionState(acquire_audio_buffer())
+        return
+    try:
+        del state.buffer[:]
+    except BufferError:
+        # A worker still holds a view over the old buffer; detach it
+        state.buffer = acquire_audio_buffer()
+    state.chunks = 0
+    state.bytes_received = 0
 
 # In-memory session image storage for multimodal context
 # Maps session_id -> base64-encoded JPEG image string
 # Cleared after each conversation turn to prevent stale context
 SESSION_IMAGES: Dict[str, str] = {}
 
+def _json_dumps(obj) -> str:
+    """Serialize a status frame for send_text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data):
+    """Parse an incoming handshake/signal frame."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# The firmware serializes its two control frames with
+# cJSON_PrintUnformatted, so the exact bytes on the wire are known ahead
+# of time (the spaced variants cover hand-typed test clients). Matching
+# against these skips JSON parsing on the per-utterance hot path.
+_EOS_FRAMES = frozenset(('{"signal":"EOS"}', '{"signal": "EOS"}'))
+_RESET_FRAMES = frozenset(('{"signal":"RESET"}', '{"signal": "RESET"}'))
+
+# Optional compact control frames: a single-byte binary frame carrying
+# one of these opcodes is equivalent to the matching JSON signal. Audio
+# is 16-bit PCM, so a one-byte frame can never be a valid audio chunk
+# and the two protocols coexist safely. The shipped firmware still
+# sends JSON; this is for clients that want to skip JSON framing.
+_BINARY_CONTROL_OPCODES = {0x01: '{"signal":"EOS"}', 0x02: '{"signal":"RESET"}'}
+
+# Control frames with no variable payload, serialized once at import so
+# the per-utterance path sends constants instead of re-encoding dicts
+_MSG_STAGE_TRANSCRIPTION = _json_dumps({"status": "processing", "stage": "transcription"})
+_MSG_EMPTY_TRANSCRIPTION = _json_dumps({
+    "status": "error",
+    "message": "Could not understand audio. Please try again."
+})
+_MSG_COMPLETE = _json_dumps({"status": "complete"})
+_MSG_RESET_COMPLETE = _json_dumps({"status": "reset_complete"})
+
+
 # Server configuration
 SERVER_HOST = os.getenv("SERVER_HOST", "0.0.0.0")
 SERVER_PORT = int(os.getenv("SERVER_PORT", 8000))
 
+# Deterministic system phrases spoken on LLM failure paths. These never
+# change at runtime, so they are pre-synthesized at startup into the TTS
+# phrase cache and error turns serve audio from memory instead of paying
+# a fresh engine round-trip.
+CANONICAL_PHRASES = (
+    "I'm sorry, I couldn't generate a response. Please try again.",
+    "Service temporarily unavailable. Please try again.",
+    "Connection error. Please check your network.",
+    "I encountered an issue processing your request. Please try again.",
+    "I'm having trouble responding right now. Please rephrase your question.",
+    "An error occurred. Please try again.",
+)
+
+# Sentence boundaries for the streamed LLM -> TTS pipeline: split after
+# terminal punctuation so each completed sentence can be synthesized
+# while later tokens are still decoding
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _drain_sentences(pending: str):
+    """Split off complete sentences, returning (sentences, remainder)."""
+    parts = _SENTENCE_SPLIT_RE.split(pending)
+    if len(parts) == 1:
+        return [], pending
+    return [part for part in parts[:-1] if part.strip()], parts[-1]
+
+
+# Response cache for context-free turns. When a session has no prior
+# conversation history and no pending image, the reply is a pure
+# function of the transcript - repeated openers ("what time is it",
+# "stop") skip the Groq round-trip and TTS synthesis entirely.
+# OrderedDict gives LRU eviction.
+RESPONSE_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# Hard cap on buffered PCM per utterance (30 s at 16-bit/16 kHz mono).
+# Bounds worst-case memory per session and stops a misbehaving client
+# from streaming without ever sending EOS.
+MAX_UTTERANCE_BYTES = 32000 * 30
+
+# Concurrent session ceiling. Each session pins an audio buffer, a Vosk
+# recognizer, and conversation context; past this the server sheds new
+# connections with 1013 (try again later) instead of degrading everyone
+MAX_CONCURRENT_SESSIONS = 128
+
+# Peak int16 amplitude below which a buffered utterance is treated as
+# silence (open mic, no speech) and skipped without flushing the
+# recognizer or touching the LLM
+SILENCE_PEAK_THRESHOLD = 300
+
+
+def _peak_amplitude(pcm: bytearray) -> int:
+    """Max absolute int16 sample in the buffer; one vectorized pass."""
+    usable = len(pcm) & ~1
+    if usable == 0:
+        return 0
+    if np is not None:
+        samples = np.frombuffer(memoryview(pcm)[:usable], dtype=np.int16)
+        return max(int(samples.max()), -int(samples.min()))
+    if audioop is not None:
+        return audioop.max(memoryview(pcm)[:usable], 2)
+    return SILENCE_PEAK_THRESHOLD  # No fast path available - never gate
+
+# WebSocket frame size for streaming TTS audio back to the device. Larger
+# frames mean fewer sendmsg syscalls and WebSocket headers per response;
+# kept well under the ESP32's receive window so playback stays smooth.
+AUDIO_STREAM_CHUNK_SIZE = int(os.getenv("AUDIO_STREAM_CHUNK_SIZE", 16384))
+
+
+# First SSID line from `netsh wlan show interfaces` output (skips BSSID)
+_SSID_RE = re.compile(r'^\s*SSID\s*:\s*(.+)$', re.MULTILINE)
+
 
 def get_network_info():
     """
     Get current network information (WiFi SSID and IP address).
+    Blocking (subprocess + sockets) - call via asyncio.to_thread.
     Returns dict with 'wifi_name', 'ip_address', 'interface'
     """
     network_info = {
@@ -96,16 +308,16 @@ def get_network_info():
                     ['netsh', 'wlan', 'show', 'interfaces'],
                     capture_output=True,
                     text=True,
-                    timeout=5
+                    timeout=5,
+                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
                 )
                 if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'SSID' in line and 'BSSID' not in line:
-                            network_info['wifi_name'] = line.split(':', 1)[1].strip()
-                            network_info['interface'] = 'WiFi'
-                            break
+                    match = _SSID_RE.search(result.stdout)
+                    if match:
+                        network_info['wifi_name'] = match.group(1).strip()
+                        network_info['interface'] = 'WiFi'
             except Exception as e:
-                print(f"Could not get WiFi SSID: {e}")
+                logger.warning("Could not get WiFi SSID: %s", e)
         
         # Get local IP address
         try:
@@ -121,11 +333,17 @@ def get_network_info():
             network_info['ip_address'] = socket.gethostbyname(socket.gethostname())
     
     except Exception as e:
-        print(f"Error getting network info: {e}")
+        logger.warning("Error getting network info: %s", e)
     
     return network_info
 
 
+def _write_image_file(path: str, data: bytes) -> None:
+    """Blocking image write, run via asyncio.to_thread."""
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -133,63 +351,85 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events using modern FastAPI approach.
     """
     # Startup
-    print("\n" + "="*60)
-    print("Hotpin Prototype Server Starting...")
-    print("="*60)
+    setup_logging()
+    
+    # Create the image directory once here instead of per upload
+    os.makedirs("captured_images", exist_ok=True)
+    logger.info("\n" + "="*60)
+    logger.info("Hotpin Prototype Server Starting...")
+    logger.info("="*60)
     
     # Display network information
-    network_info = get_network_info()
-    print(f"\nNetwork Information:")
-    print(f"   WiFi Network: {network_info['wifi_name']}")
-    print(f"   IP Address: {network_info['ip_address']}")
-    print(f"   Interface: {network_info['interface']}")
-    print(f"   Server URL: http://{network_info['ip_address']}:{SERVER_PORT}")
-    print(f"   WebSocket URL: ws://{network_info['ip_address']}:{SERVER_PORT}/ws")
-    print()
+    # Off the loop: netsh can take 200 ms and the DNS fallback can hang
+    # for seconds on a misconfigured resolver
+    network_info = await asyncio.to_thread(get_network_info)
+    logger.info("\nNetwork Information:")
+    logger.info("   WiFi Network: %s", network_info['wifi_name'])
+    logger.info("   IP Address: %s", network_info['ip_address'])
+    logger.info("   Interface: %s", network_info['interface'])
+    logger.info("   Server URL: http://%s:%s", network_info['ip_address'], SERVER_PORT)
+    logger.info("   WebSocket URL: ws://%s:%s/ws", network_info['ip_address'], SERVER_PORT)
+    logger.info("")
     
     # Initialize Groq LLM client
     try:
         init_client()
+        # Pre-warm the connection so the first utterance skips the TLS handshake
+        await warmup_client()
     except Exception as e:
-        print(f"Failed to initialize Groq client: {e}")
-        print("⚠ Server will start but LLM functionality will not work")
+        logger.error("Failed to initialize Groq client: %s", e)
+        logger.warning("⚠ Server will start but LLM functionality will not work")
     
     # Initialize Vosk STT model
     try:
         initialize_vosk_model()
         model_info = get_model_info()
-        print(f"   Model: {model_info['model_path']}")
-        print(f"   Format: {model_info['sample_rate']}Hz, {model_info['channels']} channel, {model_info['sample_width']*8}-bit")
+        logger.info("   Model: %s", model_info['model_path'])
+        logger.info("   Format: %sHz, %s channel, %s-bit", model_info['sample_rate'], model_info['channels'], model_info['sample_width']*8)
     except Exception as e:
-        print(f"Failed to initialize Vosk model: {e}")
-        print("⚠ Server will start but STT functionality will not work")
+        logger.error("Failed to initialize Vosk model: %s", e)
+        logger.warning("⚠ Server will start but STT functionality will not work")
     
     # Test pyttsx3 TTS engine
     try:
         test_tts_engine()
     except Exception as e:
-        print(f"Failed to test TTS engine: {e}")
-        print("⚠ Server will start but TTS functionality may not work")
+        logger.error("Failed to test TTS engine: %s", e)
+        logger.warning("⚠ Server will start but TTS functionality may not work")
     
-    print("="*60)
-    print(f"Server ready at ws://{SERVER_HOST}:{SERVER_PORT}/ws")
-    print("="*60 + "\n")
+    # Pre-synthesize deterministic system phrases into the phrase cache
+    # so error turns serve audio from memory instead of running the engine
+    try:
+        for phrase in CANONICAL_PHRASES:
+            await synthesize_audio(phrase)
+        logger.info("   Pre-cached %s canonical TTS phrases", len(CANONICAL_PHRASES))
+    except Exception as e:
+        logger.warning("⚠ Could not pre-cache canonical TTS phrases: %s", e)
+    
+    logger.info("="*60)
+    logger.info("Server ready at ws://%s:%s/ws", SERVER_HOST, SERVER_PORT)
+    logger.info("="*60 + "\n")
     
     yield  # Server runs here
     
     # Shutdown
-    print("\n" + "="*60)
-    print("🛑 Hotpin Prototype Server Shutting Down...")
-    print("="*60)
+    logger.info("\n" + "="*60)
+    logger.info("🛑 Hotpin Prototype Server Shutting Down...")
+    logger.info("="*60)
     
     # Close Groq client
     await close_client()
-    
+
+    # Stop the dedicated STT/TTS worker pools
+    shutdown_stt_executor()
+    shutdown_tts_executor()
+
     # Clear all session data
-    SESSION_AUDIO_BUFFERS.clear()
+    SESSIONS.clear()
     
-    print("All resources cleaned up")
-    print("="*60 + "\n")
+    logger.info("All resources cleaned up")
+    logger.info("="*60 + "\n")
+    shutdown_logging()
 
 
 # Initialize FastAPI application with lifespan
@@ -213,36 +453,51 @@ async def root():
         "websocket_endpoint": "/ws",
         "protocol": {
             "handshake": "Send JSON with {session_id: str}",
-            "audio_input": "Stream raw PCM audio (16-bit, 16kHz, mono) as binary",
+            "audio_input": "Stream raw PCM audio (16-bit, 16kHz, mono) as binary, max 30s per utterance",
             "end_of_speech": "Send JSON with {signal: 'EOS'}",
             "audio_output": "Receive WAV audio chunks as binary"
         }
     })
 
 
+# Pre-serialized response bodies for the static endpoints, filled in on
+# first request (after lifespan has loaded the model and TTS engine).
+# Probe-heavy deployments then serve raw bytes instead of re-running the
+# backend queries and dict serialization per request.
+_HEALTH_PREFIX: bytes = None
+_VOICES_BODY: bytes = None
+
+
 @app.get("/health")
 async def health_check():
     """
-    Health check endpoint
+    Health check endpoint.
+    Everything except the live session count is fixed after startup, so
+    the body is a prebuilt prefix plus the current count.
     """
-    model_info = get_model_info()
-    return JSONResponse({
-        "status": "healthy",
-        "vosk_model_loaded": model_info["model_loaded"],
-        "active_sessions": len(SESSION_AUDIO_BUFFERS)
-    })
+    global _HEALTH_PREFIX
+    if _HEALTH_PREFIX is None:
+        model_info = get_model_info()
+        loaded = "true" if model_info["model_loaded"] else "false"
+        _HEALTH_PREFIX = (
+            '{"status":"healthy","vosk_model_loaded":%s,"active_sessions":' % loaded
+        ).encode()
+    body = _HEALTH_PREFIX + str(len(SESSIONS)).encode() + b"}"
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/voices")
 async def list_voices():
     """
-    List available TTS voices
+    List available TTS voices.
+    The voice set is fixed per process; the engine enumeration runs once
+    on a worker thread and the serialized body is cached.
     """
-    voices = get_available_voices()
-    return JSONResponse({
-        "voices": voices,
-        "count": len(voices)
-    })
+    global _VOICES_BODY
+    if _VOICES_BODY is None:
+        voices = await asyncio.to_thread(get_available_voices)
+        _VOICES_BODY = _json_dumps({"voices": voices, "count": len(voices)}).encode()
+    return Response(content=_VOICES_BODY, media_type="application/json")
 
 
 @app.post("/image")
@@ -265,28 +520,26 @@ async def upload_image(
         image_data = await file.read()
         image_size = len(image_data)
         
-        print(f"📷 [{session}] Image received: {file.filename}, {image_size} bytes ({image_size/1024:.2f} KB)")
+        logger.info("📷 [%s] Image received: %s, %s bytes (%.2f KB)", session, file.filename, image_size, image_size/1024)
         
         # Convert to base64 for multimodal LLM context
         base64_image = base64.b64encode(image_data).decode('utf-8')
         
         # Store in session context for next audio interaction
         SESSION_IMAGES[session] = base64_image
-        print(f"🖼️ [{session}] Image stored in session context (base64 size: {len(base64_image)} chars)")
+        logger.info("🖼️ [%s] Image stored in session context (base64 size: %s chars)", session, len(base64_image))
         
         # Optional: Save image to disk
         
-        # Create images directory if it doesn't exist
-        os.makedirs("captured_images", exist_ok=True)
-        
         # Generate filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         save_path = f"captured_images/{session}_{timestamp}.jpg"
         
-        with open(save_path, "wb") as f:
-            f.write(image_data)
+        # Write on a worker thread - a slow SD card or spinning disk
+        # would otherwise stall the event loop and every open WebSocket
+        await asyncio.to_thread(_write_image_file, save_path, image_data)
         
-        print(f"💾 [{session}] Image saved: {save_path}")
+        logger.info("💾 [%s] Image saved: %s", session, save_path)
         
         return JSONResponse({
             "status": "success",
@@ -299,7 +552,7 @@ async def upload_image(
         })
     
     except Exception as e:
-        print(f"✗ [{session}] Image upload error: {e}")
+        logger.error("✗ [%s] Image upload error: %s", session, e)
         return JSONResponse(
             status_code=500,
             content={
@@ -324,9 +577,9 @@ async def websocket_endpoint(websocket: WebSocket):
     
     Concurrency:
     - WebSocket I/O: async (non-blocking)
-    - STT processing: sync in thread pool (via asyncio.to_thread)
+    - STT processing: sync on the dedicated STT executor
     - LLM API call: async (non-blocking)
-    - TTS synthesis: sync in thread pool (via asyncio.to_thread)
+    - TTS synthesis: sync on the dedicated TTS executor
     """
     session_id = None
     last_activity_time = asyncio.get_event_loop().time()
@@ -335,28 +588,37 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         # Accept WebSocket connection
         await websocket.accept()
-        print(f"New WebSocket connection established")
+        logger.info("New WebSocket connection established")
         
         # Step 1: Handshake - receive session ID
         handshake_message = await asyncio.wait_for(
             websocket.receive_text(),
             timeout=10.0
         )
-        handshake_data = json.loads(handshake_message)
+        handshake_data = _json_loads(handshake_message)
         session_id = handshake_data.get("session_id")
         
         if not session_id:
             await websocket.close(code=1008, reason="Missing session_id in handshake")
             return
         
-        print(f"Session initialized: {session_id}")
+        if (session_id not in SESSIONS
+                and len(SESSIONS) >= MAX_CONCURRENT_SESSIONS):
+            logger.warning("⚠ Session limit reached (%s) - rejecting %s", MAX_CONCURRENT_SESSIONS, session_id)
+            await websocket.close(code=1013, reason="Server at capacity, try again later")
+            return
+        
+        logger.info("Session initialized: %s", session_id)
+        
+        # Initialize per-session state for this connection
+        SESSIONS[session_id] = SessionState(acquire_audio_buffer())
         
-        # Initialize audio buffer for this session
-        SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
-        SESSION_AUDIO_STATS[session_id] = {"chunks": 0, "bytes": 0}
+        # Warm the session's recognizer in the background so model binding
+        # overlaps the handshake ACK and the first audio frames
+        asyncio.create_task(create_session_recognizer(session_id))
         
         # Send acknowledgment
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(_json_dumps({
             "status": "connected",
             "session_id": session_id
         }))
@@ -372,21 +634,21 @@ async def websocket_endpoint(websocket: WebSocket):
                 last_activity_time = asyncio.get_event_loop().time()
             except asyncio.TimeoutError:
                 # Check if we have pending audio data
-                if SESSION_AUDIO_BUFFERS.get(session_id) and SESSION_AUDIO_BUFFERS[session_id].tell() > 0:
-                    print(f"⏱️ [{session_id}] Streaming timeout with {SESSION_AUDIO_BUFFERS[session_id].tell()} bytes buffered - auto-processing")
+                state = SESSIONS.get(session_id)
+                if state is not None and state.buffer:
+                    logger.info("⏱️ [%s] Streaming timeout with %s bytes buffered - auto-processing", session_id, len(state.buffer))
                     # Auto-trigger EOS processing
-                    signal_data = {"signal": "EOS"}
-                    message = {"text": json.dumps(signal_data)}
+                    message = {"text": '{"signal":"EOS"}'}
                 else:
                     # ✅ CRITICAL FIX: Don't close connection or clear image context on idle timeout
                     # The device may have captured an image and is waiting for user to speak
                     # Keep connection alive and preserve image context for multimodal queries
                     if session_id in SESSION_IMAGES:
-                        print(f"⏱️ [{session_id}] Connection idle but image context present - keeping alive")
+                        logger.info("⏱️ [%s] Connection idle but image context present - keeping alive", session_id)
                         # Keep waiting for voice input
                         continue
                     else:
-                        print(f"⏱️ [{session_id}] Connection idle timeout - closing")
+                        logger.info("⏱️ [%s] Connection idle timeout - closing", session_id)
                         await websocket.close(code=1000, reason="Idle timeout")
                         break
 
@@ -394,195 +656,281 @@ async def websocket_endpoint(websocket: WebSocket):
             if message_type == "websocket.disconnect":
                 code = message.get("code", 1000)
                 reason = message.get("reason")
-                print(f"🔌 [{session_id}] WebSocket disconnect received (code={code}, reason={reason})")
+                logger.info("🔌 [%s] WebSocket disconnect received (code=%s, reason=%s)", session_id, code, reason)
                 break
             
-            # Handle binary audio data
-            if "bytes" in message:
-                audio_chunk = message["bytes"]
+            # Handle binary audio data. One .get per frame replaces the
+            # separate membership test + subscript on the hot receive path.
+            audio_chunk = message.get("bytes")
+            text_payload = message.get("text")
+            if audio_chunk is not None and len(audio_chunk) == 1:
+                # Single-byte binary control frame - reroute through the
+                # normal signal dispatch instead of the audio path
+                control = _BINARY_CONTROL_OPCODES.get(audio_chunk[0])
+                if control is not None:
+                    audio_chunk = None
+                    text_payload = control
+            if audio_chunk is not None:
                 
                 # Append to session buffer (with safe access in case of race condition)
-                buffer = SESSION_AUDIO_BUFFERS.get(session_id)
-                if buffer is None:
-                    print(f"⚠️ [{session_id}] Session buffer not found - possible race condition, reinitializing")
-                    SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
-                    SESSION_AUDIO_STATS[session_id] = {"chunks": 0, "bytes": 0}
-                    buffer = SESSION_AUDIO_BUFFERS[session_id]
+                state = SESSIONS.get(session_id)
+                if state is None:
+                    logger.warning("⚠️ [%s] Session state not found - possible race condition, reinitializing", session_id)
+                    _reset_session_buffer(session_id)
+                    state = SESSIONS[session_id]
                 
-                buffer.write(audio_chunk)
-                stats = SESSION_AUDIO_STATS.get(session_id)
-                if stats is not None:
-                    stats["chunks"] += 1
-                    stats["bytes"] += len(audio_chunk)
-                    if stats["chunks"] <= 5 or (stats["chunks"] % 25) == 0:
-                        print(
-                            f"🔊 [{session_id}] Audio chunk {stats['chunks']}: "
-                            f"{len(audio_chunk)} bytes (total streamed: {stats['bytes']})"
-                        )
+                state.buffer.extend(audio_chunk)
+
+                if len(state.buffer) > MAX_UTTERANCE_BYTES:
+                    logger.warning("⚠ [%s] Utterance exceeded %s bytes - closing connection", session_id, MAX_UTTERANCE_BYTES)
+                    await websocket.close(code=1009, reason="Utterance too long")
+                    break
+
+                # Stream the chunk straight into the session recognizer so
+                # Vosk decodes while the user is still speaking; EOS then
+                # only has to flush FinalResult instead of decoding the
+                # whole utterance after the fact
+                try:
+                    await feed_audio(session_id, audio_chunk)
+                except Exception as stt_feed_error:
+                    logger.warning("⚠ [%s] STT feed error: %s", session_id, stt_feed_error)
+
+                state.chunks += 1
+                state.bytes_received += len(audio_chunk)
+                if state.chunks <= 5 or (state.chunks % 25) == 0:
+                    logger.debug("🔊 [%s] Audio chunk %s: %s bytes (total streamed: %s)", session_id, state.chunks, len(audio_chunk), state.bytes_received)
                     
-                    # CRITICAL FIX: Send acknowledgment every 2 chunks for aggressive flow control
-                    # This provides backpressure feedback to ESP32 to prevent send buffer saturation
-                    # More frequent ACKs = better flow control at cost of slightly more overhead
-                    if (stats["chunks"] % 2) == 0:
-                        try:
-                            # Check if WebSocket is still connected before sending ACK
-                            if websocket.client_state.value == 1:  # 1 = CONNECTED state
-                                await websocket.send_text(json.dumps({
-                                    "status": "receiving",
-                                    "chunks_received": stats["chunks"],
-                                    "bytes_received": stats["bytes"]
-                                }))
-                                # Add small delay to prevent overwhelming the client with rapid ACKs
-                                await asyncio.sleep(0.01)  # 10ms breathing room
-                                # Reduced logging frequency to avoid spam
-                                if (stats["chunks"] % 10) == 0:
-                                    print(f"✓ [{session_id}] Sent acknowledgment at chunk {stats['chunks']}")
-                            else:
-                                print(f"⚠ [{session_id}] WebSocket disconnected, skipping ACK for chunk {stats['chunks']}")
-                                # Connection broken, abort audio reception
-                                break
-                        except Exception as ack_error:
-                            print(f"⚠ [{session_id}] Failed to send acknowledgment: {ack_error}")
-                            # Connection likely broken, abort gracefully
-                            print(f"   Connection state: {websocket.client_state}")
+                # CRITICAL FIX: Send acknowledgment every 2 chunks for aggressive flow control
+                # This provides backpressure feedback to ESP32 to prevent send buffer saturation
+                # More frequent ACKs = better flow control at cost of slightly more overhead
+                if (state.chunks % 2) == 0:
+                    try:
+                        # Check if WebSocket is still connected before sending ACK
+                        if websocket.client_state.value == 1:  # 1 = CONNECTED state
+                            await websocket.send_text(_json_dumps({
+                                "status": "receiving",
+                                "chunks_received": state.chunks,
+                                "bytes_received": state.bytes_received
+                            }))
+                            # Add small delay to prevent overwhelming the client with rapid ACKs
+                            await asyncio.sleep(0.01)  # 10ms breathing room
+                            # Reduced logging frequency to avoid spam
+                            if (state.chunks % 10) == 0:
+                                logger.debug("✓ [%s] Sent acknowledgment at chunk %s", session_id, state.chunks)
+                        else:
+                            logger.warning("⚠ [%s] WebSocket disconnected, skipping ACK for chunk %s", session_id, state.chunks)
+                            # Connection broken, abort audio reception
                             break
-                
-                # Optional: Send progress indicator (defensive check for race conditions)
-                if session_id in SESSION_AUDIO_BUFFERS:
-                    buffer_size = SESSION_AUDIO_BUFFERS[session_id].tell()
-                    if buffer_size % 32000 == 0:  # Every ~1 second at 16kHz
-                        print(f"📊 [{session_id}] Buffer: {buffer_size} bytes (~{buffer_size/32000:.1f}s)")
+                    except Exception as ack_error:
+                        logger.warning("⚠ [%s] Failed to send acknowledgment: %s", session_id, ack_error)
+                        # Connection likely broken, abort gracefully
+                        logger.warning("   Connection state: %s", websocket.client_state)
+                        break
+
             
             # Handle text signals (EOS, commands, etc.)
-            elif "text" in message:
-                signal_data = json.loads(message["text"])
-                signal_type = signal_data.get("signal")
+            elif text_payload is not None:
+                # Exact-match fast path for the only two expected signals;
+                # anything else falls back to a full JSON parse
+                if text_payload in _EOS_FRAMES:
+                    signal_type = "EOS"
+                elif text_payload in _RESET_FRAMES:
+                    signal_type = "RESET"
+                else:
+                    signal_type = _json_loads(text_payload).get("signal")
                 
                 if signal_type == "EOS":
-                    print(f"🎤 [{session_id}] End-of-speech signal received")
+                    logger.info("🎤 [%s] End-of-speech signal received", session_id)
                     
-                    # Extract buffered PCM audio (with defensive check for race conditions)
-                    if session_id not in SESSION_AUDIO_BUFFERS:
-                        print(f"⚠️ [{session_id}] Audio buffer not found (race condition), reinitializing")
-                        SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
-                        SESSION_AUDIO_STATS[session_id] = {"chunks": 0, "bytes": 0}
+                    # Grab the buffered PCM audio (with defensive check for race conditions)
+                    if session_id not in SESSIONS:
+                        logger.warning("⚠️ [%s] Session state not found (race condition), reinitializing", session_id)
+                        _reset_session_buffer(session_id)
                     
-                    pcm_data = SESSION_AUDIO_BUFFERS[session_id].getvalue()
+                    pcm_buffer = SESSIONS[session_id].buffer
                     
-                    if len(pcm_data) == 0:
-                        print(f"⚠ [{session_id}] Empty audio buffer, skipping processing")
-                        # Reset buffer
-                        SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
-                        SESSION_AUDIO_STATS[session_id] = {"chunks": 0, "bytes": 0}
+                    if len(pcm_buffer) == 0:
+                        logger.warning("⚠ [%s] Empty audio buffer, skipping processing", session_id)
+                        _reset_session_buffer(session_id)
                         continue
                     
-                    print(f"🔄 [{session_id}] Processing {len(pcm_data)} bytes of audio...")
+                    # Cheap energy gate before any thread hop: an open mic
+                    # with no speech yields near-zero samples, and scanning
+                    # even a 10 s buffer is sub-millisecond
+                    if _peak_amplitude(pcm_buffer) < SILENCE_PEAK_THRESHOLD:
+                        logger.info("🔇 [%s] Buffer is silence - skipping transcription", session_id)
+                        await discard_utterance(session_id)
+                        if websocket.client_state.value == 1:
+                            await websocket.send_text(_MSG_EMPTY_TRANSCRIPTION)
+                        _reset_session_buffer(session_id)
+                        continue
+                    
+                    logger.info("🔄 [%s] Finalizing %s bytes of streamed audio...", session_id, len(pcm_buffer))
                     
                     try:
                         # Send processing indicator (check connection first)
                         if websocket.client_state.value == 1:  # 1 = CONNECTED
-                            await websocket.send_text(json.dumps({
-                                "status": "processing",
-                                "stage": "transcription"
-                            }))
-                            await asyncio.sleep(0.01)  # Small delay between sends
+                            await websocket.send_text(_MSG_STAGE_TRANSCRIPTION)
                         else:
-                            print(f"⚠ [{session_id}] WebSocket disconnected before processing - aborting")
+                            logger.warning("⚠ [%s] WebSocket disconnected before processing - aborting", session_id)
                             continue
                         
-                        # Step 2: STT - Transcribe audio (blocking, run in thread pool)
-                        transcript = await asyncio.to_thread(
-                            process_audio_for_transcription,
-                            session_id,
-                            pcm_data
-                        )
+                        # Step 2: STT - Flush the recognizer. The audio was
+                        # already fed chunk-by-chunk during capture, so this
+                        # only waits for FinalResult, not a full decode
+                        transcript = await finalize_utterance(session_id)
                         
                         if not transcript or transcript.strip() == "":
-                            print(f"⚠ [{session_id}] Empty transcription")
+                            logger.warning("⚠ [%s] Empty transcription", session_id)
                             if websocket.client_state.value == 1:  # Check connection before sending
-                                await websocket.send_text(json.dumps({
-                                    "status": "error",
-                                    "message": "Could not understand audio. Please try again."
-                                }))
+                                await websocket.send_text(_MSG_EMPTY_TRANSCRIPTION)
                                 await asyncio.sleep(0.01)
-                            # Reset buffer
-                            SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
+                            _reset_session_buffer(session_id)
                             continue
                         
-                        print(f"📝 [{session_id}] Transcript: \"{transcript}\"")
+                        logger.info("📝 [%s] Transcript: \"%s\"", session_id, transcript)
                         
                         # Check for stored image context
                         image_context = SESSION_IMAGES.get(session_id)
                         if image_context:
-                            print(f"🖼️ [{session_id}] Using stored image context for LLM request (base64 length: {len(image_context)})")
+                            logger.info("🖼️ [%s] Using stored image context for LLM request (base64 length: %s)", session_id, len(image_context))
                         else:
-                            print(f"ℹ️ [{session_id}] No image context found for this session")
-                            print(f"   Available sessions with images: {list(SESSION_IMAGES.keys())}")
+                            logger.info("ℹ️ [%s] No image context found for this session", session_id)
+                            logger.info("   Available sessions with images: %s", list(SESSION_IMAGES.keys()))
                         
                         # Send transcript to client (optional feedback)
                         if websocket.client_state.value == 1:
-                            await websocket.send_text(json.dumps({
+                            await websocket.send_text(_json_dumps({
                                 "status": "processing",
                                 "stage": "llm",
                                 "transcript": transcript,
                                 "has_image": image_context is not None
                             }))
-                            await asyncio.sleep(0.01)
                         
-                        # Step 3: LLM - Get response (async, non-blocking) with optional image
-                        llm_response = await get_llm_response(session_id, transcript, image_base64=image_context)
+                        # Cache lookup for context-free turns
+                        cache_key = None
+                        cached_turn = None
+                        if image_context is None:
+                            session_context = get_session_context(session_id)
+                            if not session_context or not session_context.get("history"):
+                                cache_key = transcript.strip().lower()
+                                cached_turn = RESPONSE_CACHE.get(cache_key)
+
+                        if cached_turn is not None:
+                            RESPONSE_CACHE.move_to_end(cache_key)
+                            llm_response, wav_bytes = cached_turn
+                            # Record the turn so follow-ups still see it in context
+                            manage_context(session_id, "user", transcript)
+                            manage_context(session_id, "assistant", llm_response)
+                            logger.info("⚡ [%s] Response cache hit - skipping LLM and TTS", session_id)
+                            if websocket.client_state.value == 1:
+                                await websocket.send_text(_json_dumps({
+                                    "status": "processing",
+                                    "stage": "tts",
+                                    "response": llm_response
+                                }))
+                        else:
+                            # Step 3: LLM - Stream response deltas and hand each
+                            # completed sentence to the TTS pool immediately, so
+                            # synthesis overlaps the tail of LLM decoding. The
+                            # device protocol still requires ONE WAV (a single
+                            # header), so per-sentence synthesis returns raw PCM
+                            # that is concatenated and wrapped once below.
+                            llm_response = ""
+                            pcm_tasks = []
+                            try:
+                                pending_text = ""
+                                async for delta in stream_llm_response(session_id, transcript, image_base64=image_context):
+                                    llm_response += delta
+                                    pending_text += delta
+                                    sentences, pending_text = _drain_sentences(pending_text)
+                                    for sentence in sentences:
+                                        pcm_tasks.append(asyncio.create_task(synthesize_pcm(sentence)))
+                                if pending_text.strip():
+                                    pcm_tasks.append(asyncio.create_task(synthesize_pcm(pending_text.strip())))
+                            except Exception as stream_error:
+                                logger.warning("⚠ [%s] LLM streaming failed: %s", session_id, stream_error)
+                                for task in pcm_tasks:
+                                    task.cancel()
+                                pcm_tasks = []
+                                llm_response = ""
+                                # Failed turn - never cache the fallback, or a
+                                # transient LLM outage would pin the canned
+                                # error to this transcript for every session
+                                cache_key = None
                         
-                        print(f"🤖 [{session_id}] LLM response: \"{llm_response}\"")
+                            logger.info("🤖 [%s] LLM response: \"%s\"", session_id, llm_response)
                         
-                        # Clear image context after use to prevent stale context
-                        if image_context:
-                            del SESSION_IMAGES[session_id]
-                            print(f"🗑️ [{session_id}] Cleared image context after use")
+                            # Clear image context after use to prevent stale context
+                            if image_context:
+                                del SESSION_IMAGES[session_id]
+                                logger.info("🗑️ [%s] Cleared image context after use", session_id)
                         
-                        # Validate LLM response before TTS synthesis
-                        if not llm_response or llm_response.strip() == "":
-                            print(f"⚠ [{session_id}] Empty LLM response, using fallback message")
-                            llm_response = "I'm sorry, I couldn't generate a response. Please try again."
+                            # Validate LLM response before TTS synthesis
+                            if not llm_response or llm_response.strip() == "":
+                                logger.warning("⚠ [%s] Empty LLM response, using fallback message", session_id)
+                                llm_response = "I'm sorry, I couldn't generate a response. Please try again."
+                                # Fallback text is not a real answer - keep it
+                                # out of the response cache
+                                cache_key = None
                         
-                        # Send LLM response text (optional feedback)
-                        if websocket.client_state.value == 1:
-                            await websocket.send_text(json.dumps({
-                                "status": "processing",
-                                "stage": "tts",
-                                "response": llm_response
-                            }))
-                            await asyncio.sleep(0.01)
-                        else:
-                            print(f"⚠ [{session_id}] WebSocket disconnected during LLM response")
-                            # Continue to cleanup section
+                            # Send LLM response text (optional feedback)
+                            if websocket.client_state.value == 1:
+                                await websocket.send_text(_json_dumps({
+                                    "status": "processing",
+                                    "stage": "tts",
+                                    "response": llm_response
+                                }))
+                            else:
+                                logger.warning("⚠ [%s] WebSocket disconnected during LLM response", session_id)
+                                # Continue to cleanup section
                         
-                        # Step 4: TTS - Synthesize COMPLETE audio in ONE WAV file
-                        # CRITICAL FIX: Generate one continuous WAV instead of multiple WAV files per sentence
-                        # The ESP32 TTS decoder expects a single WAV header followed by PCM data,
-                        # not multiple concatenated WAV files (which would have multiple headers)
-                        print(f"🔊 [{session_id}] Synthesizing complete audio response...")
-                        wav_bytes = await asyncio.to_thread(
-                            synthesize_response_audio,
-                            llm_response  # Send FULL response, not sentence-by-sentence
-                        )
+                            # Step 4: TTS - Assemble COMPLETE audio as ONE WAV file.
+                            # The ESP32 TTS decoder expects a single WAV header
+                            # followed by PCM data, so the per-sentence PCM pieces
+                            # are joined under one header; if the pipelined path
+                            # produced nothing (stream failure or fallback text),
+                            # synthesize the full response in one go instead.
+                            wav_bytes = b""
+                            if pcm_tasks:
+                                try:
+                                    pcm_parts = await asyncio.gather(*pcm_tasks)
+                                    wav_bytes = build_wav_bytes(b"".join(pcm_parts))
+                                except Exception as tts_error:
+                                    logger.warning("⚠ [%s] Pipelined synthesis failed: %s", session_id, tts_error)
+                                    wav_bytes = b""
+                            if not wav_bytes:
+                                logger.info("🔊 [%s] Synthesizing complete audio response...", session_id)
+                                wav_bytes = await synthesize_audio(llm_response)
+
+                            if cache_key is not None:
+                                RESPONSE_CACHE[cache_key] = (llm_response, wav_bytes)
+                                while len(RESPONSE_CACHE) > RESPONSE_CACHE_MAX_ENTRIES:
+                                    RESPONSE_CACHE.popitem(last=False)
                         
-                        print(f"🔊 [{session_id}] Streaming {len(wav_bytes)} bytes of audio response...")
+                        logger.info("🔊 [%s] Streaming %s bytes of audio response...", session_id, len(wav_bytes))
                         
-                        # Step 5: Stream audio response in chunks (async)
-                        chunk_size = 4096  # 4KB chunks
+                        # Step 5: Stream audio response in chunks (async).
+                        # 16 KB frames cut syscall and frame-header overhead
+                        # 4x vs the old 4 KB chunks while staying small
+                        # enough for the ESP32 to buffer; memoryview slices
+                        # avoid copying each chunk out of wav_bytes.
+                        # (TCP_NODELAY is already set by asyncio/uvicorn on
+                        # the underlying transport.)
+                        chunk_size = AUDIO_STREAM_CHUNK_SIZE
                         total_chunks = 0
+                        wav_view = memoryview(wav_bytes)
                         for i in range(0, len(wav_bytes), chunk_size):
                             # Check connection before each chunk
                             if websocket.client_state.value != 1:
-                                print(f"⚠ [{session_id}] WebSocket disconnected during audio streaming")
+                                logger.warning("⚠ [%s] WebSocket disconnected during audio streaming", session_id)
                                 break
-                            chunk = wav_bytes[i:i + chunk_size]
-                            await websocket.send_bytes(chunk)
+                            await websocket.send_bytes(wav_view[i:i + chunk_size])
                             total_chunks += 1
                             # Small delay between chunks to prevent overwhelming client
                             await asyncio.sleep(0.005)  # 5ms between audio chunks
                         
-                        print(f"✓ [{session_id}] Streamed {total_chunks} audio chunks ({len(wav_bytes)} bytes)")
+                        logger.info("✓ [%s] Streamed %s audio chunks (%s bytes)", session_id, total_chunks, len(wav_bytes))
                         
                         # CRITICAL FIX: Wait for all audio chunks to be buffered on client side
                         # before sending completion signal. This prevents race condition where
@@ -597,62 +945,58 @@ async def websocket_endpoint(websocket: WebSocket):
                             if websocket.client_state.value == 1:
                                 await websocket.send_bytes(b"")  # Zero-length binary frame as EOS marker
                                 await asyncio.sleep(0.01)
-                                print(f"✓ [{session_id}] End-of-audio marker sent (zero-length frame)")
+                                logger.info("✓ [%s] End-of-audio marker sent (zero-length frame)", session_id)
                             
                             # Send completion signal (check connection first)
                             if websocket.client_state.value == 1:
-                                await websocket.send_text(json.dumps({
-                                    "status": "complete"
-                                }))
+                                await websocket.send_text(_MSG_COMPLETE)
                                 await asyncio.sleep(0.01)
-                                print(f"✓ [{session_id}] Completion signal sent")
+                                logger.info("✓ [%s] Completion signal sent", session_id)
                             
-                            print(f"✓ [{session_id}] Response streaming complete")
+                            logger.info("✓ [%s] Response streaming complete", session_id)
                         except Exception as send_error:
                             # Client may have disconnected during audio playback - this is normal
-                            print(f"⚠ [{session_id}] Could not send completion signals: {send_error}")
-                            print(f"   Client likely disconnected during playback - not an error")
+                            logger.warning("⚠ [%s] Could not send completion signals: %s", session_id, send_error)
+                            logger.warning("   Client likely disconnected during playback - not an error")
                     
                     except Exception as processing_error:
-                        import traceback
                         error_details = traceback.format_exc()
-                        print(f"✗ [{session_id}] Processing error: {processing_error}")
-                        print(f"   Stack trace:\n{error_details}")
+                        logger.error("✗ [%s] Processing error: %s", session_id, processing_error)
+                        logger.error("   Stack trace:\n%s", error_details)
                         # Only send error message if connection still active
                         if websocket.client_state.value == 1:
                             try:
-                                await websocket.send_text(json.dumps({
+                                await websocket.send_text(_json_dumps({
                                     "status": "error",
                                     "message": "An error occurred while processing your request.",
                                     "error_type": type(processing_error).__name__
                                 }))
                             except Exception as send_error:
-                                print(f"⚠ [{session_id}] Could not send error message: {send_error}")
+                                logger.warning("⚠ [%s] Could not send error message: %s", session_id, send_error)
                     
                     finally:
                         # Reset audio buffer for next utterance
-                        SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
-                        SESSION_AUDIO_STATS[session_id] = {"chunks": 0, "bytes": 0}
-                        print(f"🔄 [{session_id}] Buffer reset, ready for next input")
+                        _reset_session_buffer(session_id)
+                        logger.info("🔄 [%s] Buffer reset, ready for next input", session_id)
                 
                 elif signal_type == "RESET":
                     # Reset conversation context
                     clear_session_context(session_id)
-                    SESSION_AUDIO_BUFFERS[session_id] = io.BytesIO()
+                    _reset_session_buffer(session_id)
+                    # Drop any partially decoded audio along with the buffer
+                    await discard_utterance(session_id)
                     if session_id in SESSION_IMAGES:
                         del SESSION_IMAGES[session_id]
-                        print(f"🗑️ [{session_id}] Cleared stored image context on reset")
+                        logger.info("🗑️ [%s] Cleared stored image context on reset", session_id)
                     if websocket.client_state.value == 1:
-                        await websocket.send_text(json.dumps({
-                            "status": "reset_complete"
-                        }))
-                    print(f"🔄 [{session_id}] Session reset")
+                        await websocket.send_text(_MSG_RESET_COMPLETE)
+                    logger.info("🔄 [%s] Session reset", session_id)
     
     except WebSocketDisconnect:
-        print(f"WebSocket disconnected: {session_id}")
+        logger.info("WebSocket disconnected: %s", session_id)
     
     except Exception as e:
-        print(f"WebSocket error [{session_id}]: {e}")
+        logger.error("WebSocket error [%s]: %s", session_id, e)
         try:
             await websocket.close(code=1011, reason=f"Server error: {str(e)}")
         except:
@@ -661,22 +1005,22 @@ async def websocket_endpoint(websocket: WebSocket):
     finally:
         # Cleanup session data
         if session_id:
-            if session_id in SESSION_AUDIO_BUFFERS:
-                del SESSION_AUDIO_BUFFERS[session_id]
-            if session_id in SESSION_AUDIO_STATS:
-                del SESSION_AUDIO_STATS[session_id]
+            state = SESSIONS.pop(session_id, None)
+            if state is not None:
+                release_audio_buffer(state.buffer)
             
             # ✅ CRITICAL FIX: Don't clear image context on disconnect
             # ESP32 may disconnect/reconnect between image capture and voice query
             # Image context should persist across reconnections for same session_id
             # Images will be cleared after use in LLM processing or after extended timeout
             if session_id in SESSION_IMAGES:
-                print(f"� [{session_id}] Image context preserved for reconnection")
+                logger.info("� [%s] Image context preserved for reconnection", session_id)
                 # Optional: Start a timer to clear stale images after 5 minutes
                 # For now, images cleared after use in LLM processing
             
             clear_session_context(session_id)
-            print(f"🧹 [{session_id}] Session cleaned up")
+            release_session_recognizer(session_id)
+            logger.info("🧹 [%s] Session cleaned up", session_id)
 
 
 if __name__ == "__main__":
@@ -688,6 +1032,10 @@ if __name__ == "__main__":
     
     # 🔧 CRITICAL FIX: Configure Uvicorn with aggressive WebSocket keepalive and timeouts
     # These settings prevent premature connection closure during audio streaming
+    # uvicorn[standard] ships uvloop and httptools, and the default
+    # loop="auto"/http="auto" already select them where available (uvloop
+    # on Linux/macOS), so only the WebSocket compression knob needs setting:
+    # permessage-deflate is pure CPU loss on raw PCM audio frames.
     uvicorn.run(
         app,
         host=SERVER_HOST,
@@ -695,5 +1043,6 @@ if __name__ == "__main__":
         log_level="info",
         ws_ping_interval=20,        # Send WebSocket ping every 20 seconds to keep connection alive
         ws_ping_timeout=60,          # Wait 60 seconds for pong response before closing connection
+        ws_per_message_deflate=False,  # Don't try to compress incompressible PCM audio
         timeout_keep_alive=120       # Keep HTTP connection alive for 120 seconds (affects WebSocket upgrade)
     )